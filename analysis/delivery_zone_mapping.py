@@ -10,11 +10,94 @@ Date: 2024
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import math
-import warnings
-warnings.filterwarnings('ignore')
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None  # The CSV is then parsed on every load, without a Parquet cache
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Compact measure types, shared by the CSV parse and injected frames
+_SAMPLE_DTYPES = {
+    'category': 'category',
+    'delivery_time_minutes': 'float32',
+    'csat_score': 'float32',
+    'orders_fulfilled': 'int32',
+    'orders_cancelled': 'int32'
+}
+
+# Part of the Parquet cache key with _SAMPLE_DTYPES: bump it whenever the
+# columns _prepare_sample_data derives change, so older caches are rebuilt
+_PARQUET_CACHE_VERSION = 1
+
+# Traffic bucket for each hour of the day: 0 = off-peak, 1 = business, 2 = peak
+_HOUR_BUCKET = np.zeros(24, dtype=np.uint8)
+_HOUR_BUCKET[10:17] = 1
+_HOUR_BUCKET[[7, 8, 9, 17, 18, 19, 20]] = 2
+
+# Base courier speed for each hour of the day (km/h)
+_SPEED_BY_BUCKET = np.array([35.0, 25.0, 15.0])
+_SPEED_BY_HOUR = _SPEED_BY_BUCKET[_HOUR_BUCKET]
+
+@njit(cache=True, fastmath=True)
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """Haversine distance in kilometers between two points given in degrees."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    sin_half_dlat = math.sin((phi2 - phi1) * 0.5)
+    sin_half_dlon = math.sin(math.radians(lon2 - lon1) * 0.5)
+    a = (sin_half_dlat * sin_half_dlat +
+         math.cos(phi1) * math.cos(phi2) * sin_half_dlon * sin_half_dlon)
+    
+    # 2 * R * asin(sqrt(a)) equals 2 * R * atan2(sqrt(a), sqrt(1 - a)) with one
+    # less sqrt; 12742 km is Earth's diameter. min() guards rounding past 1.0
+    return 12742.0 * math.asin(math.sqrt(min(a, 1.0)))
+
+@njit(cache=True, fastmath=True)
+def _pairwise_haversine_km(lat, lon):
+    """Symmetric matrix of Haversine distances in kilometers between points in degrees."""
+    n = lat.shape[0]
+    distances = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = _haversine_km(lat[i], lon[i], lat[j], lon[j])
+            distances[i, j] = d
+            distances[j, i] = d
+    return distances
+
+def warmup_jit():
+    """Compile the Numba kernels ahead of the first zone analysis."""
+    _haversine_km(0.0, 0.0, 0.0, 0.0)
+    _pairwise_haversine_km(np.zeros(2), np.zeros(2))
+
+@dataclass
+class ZoneContext:
+    """
+    Delivery zone analysis results shared by the report and its recommendations.
+    
+    Attributes:
+        performance (pd.DataFrame): Output of analyze_delivery_performance()
+        traffic (dict): Output of identify_traffic_patterns()
+        zones (dict): Output of generate_delivery_zones()
+        overlap (pd.DataFrame): Output of calculate_zone_overlap()
+    """
+    performance: pd.DataFrame
+    traffic: dict
+    zones: dict
+    overlap: pd.DataFrame
 
 class DeliveryZoneMapper:
     """
@@ -43,7 +126,71 @@ class DeliveryZoneMapper:
             'DS004': {'lat': 12.9279, 'lon': 77.6271, 'name': 'BTM Layout'},
             'DS005': {'lat': 13.0358, 'lon': 77.5970, 'name': 'Hebbal'}
         }
+        self._zone_cache = {}
+        
+    def _load_sample_data(self):
+        """
+        Load sample_data.csv through a typed Parquet cache.
+        
+        The first load parses the CSV, applies the column types used by the
+        analysis and writes sample_data.parquet next to it, keyed in its
+        metadata by the cache version and column types. Later loads read the
+        Parquet file directly while it is newer than the CSV and its key
+        matches. Without pyarrow installed the CSV is parsed on every call.
         
+        Returns:
+            pd.DataFrame: Sample data with parsed timestamps and an hour column
+        """
+        csv_path = f'{self.data_path}sample_data.csv'
+        parquet_path = f'{self.data_path}sample_data.parquet'
+        cache_key = f'{_PARQUET_CACHE_VERSION}:{sorted(_SAMPLE_DTYPES.items())}'.encode()
+        
+        if (pq is not None and os.path.exists(parquet_path) and
+                os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+            try:
+                if (pq.read_schema(parquet_path).metadata or {}).get(b'cache_key') == cache_key:
+                    return pd.read_parquet(parquet_path)
+            except (OSError, ValueError, pa.ArrowException):
+                pass  # Fall back to the CSV below
+        
+        # Parse measures straight into compact dtypes to cut memory traffic
+        data = pd.read_csv(csv_path, dtype=_SAMPLE_DTYPES)
+        data['timestamp'] = pd.to_datetime(data['timestamp'])
+        data = self._prepare_sample_data(data)
+        
+        if pq is not None:
+            try:
+                table = pa.Table.from_pandas(data, preserve_index=False)
+                table = table.replace_schema_metadata({**table.schema.metadata, b'cache_key': cache_key})
+                pq.write_table(table, parquet_path, compression='snappy')
+            except (OSError, ValueError, pa.ArrowException):
+                pass  # Caching is best effort; the parsed CSV is still usable
+        
+        return data
+    
+    @staticmethod
+    def _prepare_sample_data(data):
+        """
+        Derive the hour column and lay out the columns for the groupbys.
+        
+        Args:
+            data (pd.DataFrame): Sample data with a parsed timestamp column
+            
+        Returns:
+            pd.DataFrame: The same frame, ready for zone analysis
+        """
+        if 'hour' not in data.columns:
+            data['hour'] = data['timestamp'].dt.hour
+        data['hour'] = data['hour'].astype(np.uint8)
+        
+        # Give groupby kernels contiguous numeric columns to scan
+        for col in ['delivery_time_minutes', 'csat_score', 'orders_fulfilled', 'orders_cancelled']:
+            data[col] = np.ascontiguousarray(data[col].to_numpy())
+        
+        # Group on integer category codes rather than hashing strings
+        data['dark_store_id'] = data['dark_store_id'].astype('category')
+        return data
+    
     def load_data(self):
         """
         Load all required datasets for delivery zone analysis.
@@ -52,28 +199,59 @@ class DeliveryZoneMapper:
             bool: True if all data loaded successfully, False otherwise
         """
         try:
-            self.sample_data = pd.read_csv(f'{self.data_path}sample_data.csv')
-            self.sample_data['timestamp'] = pd.to_datetime(self.sample_data['timestamp'])
-            self.sample_data['hour'] = self.sample_data['timestamp'].dt.hour
-            
-            # Update dark_stores to only include stores that exist in the data
-            available_stores = self.sample_data['dark_store_id'].unique()
-            original_stores = self.dark_stores.copy()
-            self.dark_stores = {k: v for k, v in self.dark_stores.items() if k in available_stores}
-            
-            print(f"✅ Data loaded successfully!")
-            print(f"📍 Available dark stores: {list(self.dark_stores.keys())}")
-            
-            missing_stores = set(original_stores.keys()) - set(self.dark_stores.keys())
-            if missing_stores:
-                print(f"⚠️ Note: These stores are defined but have no data: {list(missing_stores)}")
+            self._set_sample_data(self._load_sample_data())
+            return True
             
+        except Exception as e:
+            print(f"❌ Error loading data: {str(e)}")
+            return False
+    
+    def load_frames(self, frames):
+        """
+        Load datasets from DataFrames the caller has already read.
+        
+        Lets several analyzers share a single parse of the CSVs. The sample
+        data is cast on a new frame, so the shared one is left untouched.
+        
+        Args:
+            frames (dict): DataFrames keyed by dataset name; only
+                'sample_data', with a parsed timestamp column, is used
+                
+        Returns:
+            bool: True if all data loaded successfully, False otherwise
+        """
+        try:
+            self._set_sample_data(
+                self._prepare_sample_data(frames['sample_data'].astype(_SAMPLE_DTYPES))
+            )
             return True
             
         except Exception as e:
             print(f"❌ Error loading data: {str(e)}")
             return False
     
+    def _set_sample_data(self, data):
+        """
+        Install loaded sample data and narrow dark_stores to the stores in it.
+        
+        Args:
+            data (pd.DataFrame): Prepared sample data
+        """
+        self.sample_data = data
+        
+        # Update dark_stores to only include stores that exist in the data
+        available_stores = self.sample_data['dark_store_id'].unique()
+        original_stores = self.dark_stores.copy()
+        self.dark_stores = {k: v for k, v in self.dark_stores.items() if k in available_stores}
+        self._zone_cache = {}
+        
+        print(f"✅ Data loaded successfully!")
+        print(f"📍 Available dark stores: {list(self.dark_stores.keys())}")
+        
+        missing_stores = set(original_stores.keys()) - set(self.dark_stores.keys())
+        if missing_stores:
+            print(f"⚠️ Note: These stores are defined but have no data: {list(missing_stores)}")
+    
     def calculate_distance(self, lat1, lon1, lat2, lon2):
         """
         Calculate distance between two points using Haversine formula.
@@ -85,43 +263,44 @@ class DeliveryZoneMapper:
         Returns:
             float: Distance in kilometers
         """
-        R = 6371  # Earth's radius in kilometers
+        return _haversine_km(lat1, lon1, lat2, lon2)
+    
+    def calculate_pairwise_distances(self, store_ids):
+        """
+        Calculate the Haversine distance between every pair of dark stores.
         
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = (math.sin(dlat/2) * math.sin(dlat/2) + 
-             math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * 
-             math.sin(dlon/2) * math.sin(dlon/2))
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        distance = R * c
+        Args:
+            store_ids (list): Dark store IDs to include, in matrix order
+            
+        Returns:
+            np.ndarray: Symmetric (N, N) distance matrix in kilometers
+        """
+        coords = np.array(
+            [[self.dark_stores[s]['lat'], self.dark_stores[s]['lon']] for s in store_ids],
+            dtype=np.float64
+        ).reshape(-1, 2)
         
-        return distance
+        return _pairwise_haversine_km(
+            np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1])
+        )
     
     def calculate_travel_time(self, distance_km, hour, traffic_factor=1.0):
         """
         Calculate travel time based on distance, hour, and traffic conditions.
         
         Args:
-            distance_km (float): Distance in kilometers
-            hour (int): Hour of the day (0-23)
+            distance_km (float or np.ndarray): Distance in kilometers
+            hour (int or np.ndarray): Hour of the day (0-23)
             traffic_factor (float): Traffic multiplication factor
             
         Returns:
-            float: Travel time in minutes
+            float or np.ndarray: Travel time in minutes
         """
         # Base speed in different traffic conditions (km/h)
-        if hour in [7, 8, 9, 17, 18, 19, 20]:  # Peak hours
-            base_speed = 15 * traffic_factor  # Slower during peak hours
-        elif hour in [10, 11, 12, 13, 14, 15, 16]:  # Business hours
-            base_speed = 25 * traffic_factor
-        else:  # Off-peak hours
-            base_speed = 35 * traffic_factor
-        
-        # Add pickup and delivery time
-        pickup_delivery_time = 3  # 3 minutes total
-        
-        travel_time = (distance_km / base_speed) * 60 + pickup_delivery_time
-        return travel_time
+        base_speed = _SPEED_BY_HOUR[hour] * traffic_factor
+        
+        # Riding time plus 3 minutes total for pickup and delivery
+        return distance_km / base_speed * 60 + 3
     
     def generate_delivery_zones(self, target_delivery_time=12):
         """
@@ -133,42 +312,65 @@ class DeliveryZoneMapper:
         Returns:
             dict: Delivery zones for each dark store
         """
+        if target_delivery_time in self._zone_cache:
+            return self._zone_cache[target_delivery_time]
+        
         delivery_zones = {}
         
+        # Travel time is linear in distance, so solve for the radius directly
+        # instead of searching for it: t = d / speed * 60 + 3
+        hours = np.arange(24)
+        radii = np.clip((target_delivery_time - 3) * _SPEED_BY_HOUR / 60, 0.1, 10.0)
+        
+        # Hourly zone metrics depend only on the hour, so every store shares
+        # the same 24-element arrays; all arithmetic happens here, once
+        radius_km = np.round(radii, 2)
+        delivery_time = np.round(self.calculate_travel_time(radii, hours), 1)
+        coverage_km2 = np.round(np.pi * radii ** 2, 2)
+        avg_radius = round(radius_km.mean(), 2)
+        avg_coverage = round(coverage_km2.mean(), 2)
+        
+        hourly_values = list(zip(hours.tolist(), radius_km.tolist(),
+                                 delivery_time.tolist(), coverage_km2.tolist()))
+        
         for store_id, store_info in self.dark_stores.items():
-            zones = {}
-            
-            # Calculate zones for different times of day
-            for hour in range(24):
-                # Binary search to find optimal radius
-                min_radius = 0.1
-                max_radius = 10.0
-                optimal_radius = 1.0
-                
-                for _ in range(20):  # Binary search iterations
-                    test_radius = (min_radius + max_radius) / 2
-                    estimated_time = self.calculate_travel_time(test_radius, hour)
-                    
-                    if estimated_time <= target_delivery_time:
-                        optimal_radius = test_radius
-                        min_radius = test_radius
-                    else:
-                        max_radius = test_radius
-                
-                zones[hour] = {
-                    'radius_km': round(optimal_radius, 2),
-                    'estimated_delivery_time': round(self.calculate_travel_time(optimal_radius, hour), 1),
-                    'coverage_area_km2': round(math.pi * optimal_radius ** 2, 2)
-                }
+            delivery_zones[store_id] = self._compute_store_zone(
+                store_info, hourly_values, avg_radius, avg_coverage
+            )
+        
+        self._zone_cache[target_delivery_time] = delivery_zones
+        return delivery_zones
+    
+    def _compute_store_zone(self, store_info, hourly_values, avg_radius, avg_coverage):
+        """
+        Build the delivery zone entry for a single dark store.
+        
+        Args:
+            store_info (dict): Store location and name
+            hourly_values (list): (hour, radius_km, estimated_delivery_time,
+                coverage_area_km2) tuples for each hour of the day
+            avg_radius (float): Average radius over the day in kilometers
+            avg_coverage (float): Average coverage over the day in km²
             
-            delivery_zones[store_id] = {
-                'store_info': store_info,
-                'hourly_zones': zones,
-                'avg_radius': round(np.mean([z['radius_km'] for z in zones.values()]), 2),
-                'avg_coverage': round(np.mean([z['coverage_area_km2'] for z in zones.values()]), 2)
+        Returns:
+            dict: Store info, hourly zones and daily averages
+        """
+        # Calculate zones for different times of day
+        zones = {
+            hour: {
+                'radius_km': radius,
+                'estimated_delivery_time': est_time,
+                'coverage_area_km2': area
             }
+            for hour, radius, est_time, area in hourly_values
+        }
         
-        return delivery_zones
+        return {
+            'store_info': store_info,
+            'hourly_zones': zones,
+            'avg_radius': avg_radius,
+            'avg_coverage': avg_coverage
+        }
     
     def analyze_delivery_performance(self):
         """
@@ -181,31 +383,33 @@ class DeliveryZoneMapper:
             print("❌ Please load data first using load_data()")
             return None
         
-        performance_analysis = self.sample_data.groupby(['dark_store_id', 'hour']).agg({
-            'delivery_time_minutes': ['mean', 'std', 'min', 'max'],
-            'orders_fulfilled': 'sum',
-            'orders_cancelled': 'sum',
-            'csat_score': 'mean'
-        }).round(2)
-        
-        # Flatten column names
-        performance_analysis.columns = ['_'.join(col).strip() for col in performance_analysis.columns.values]
-        performance_analysis = performance_analysis.reset_index()
-        
-        # Calculate derived metrics
-        performance_analysis['total_orders'] = (
-            performance_analysis['orders_fulfilled_sum'] + 
-            performance_analysis['orders_cancelled_sum']
+        # Named aggregations produce flat column names directly
+        performance_analysis = self.sample_data.groupby(['dark_store_id', 'hour'], observed=True).agg(
+            delivery_time_minutes_mean=('delivery_time_minutes', 'mean'),
+            delivery_time_minutes_std=('delivery_time_minutes', 'std'),
+            delivery_time_minutes_min=('delivery_time_minutes', 'min'),
+            delivery_time_minutes_max=('delivery_time_minutes', 'max'),
+            orders_fulfilled_sum=('orders_fulfilled', 'sum'),
+            orders_cancelled_sum=('orders_cancelled', 'sum'),
+            csat_score_mean=('csat_score', 'mean')
+        ).round(2).reset_index()
+        
+        # Calculate derived metrics on plain arrays, skipping index alignment
+        fulfilled = performance_analysis['orders_fulfilled_sum'].to_numpy()
+        cancelled = performance_analysis['orders_cancelled_sum'].to_numpy()
+        total_orders = fulfilled + cancelled
+        
+        performance_analysis['total_orders'] = total_orders
+        
+        performance_analysis['success_rate'] = np.divide(
+            fulfilled, total_orders,
+            out=np.zeros(len(total_orders), dtype=float),
+            where=total_orders > 0
         )
         
-        performance_analysis['success_rate'] = (
-            performance_analysis['orders_fulfilled_sum'] / 
-            performance_analysis['total_orders']
-        ).fillna(0)
-        
         performance_analysis['on_time_delivery'] = (
-            performance_analysis['delivery_time_minutes_mean'] <= 15
-        ).astype(int)
+            performance_analysis['delivery_time_minutes_mean'].to_numpy() <= 15
+        ).astype(np.int8)
         
         return performance_analysis
     
@@ -231,10 +435,15 @@ class DeliveryZoneMapper:
         
         # Classify traffic conditions
         avg_delivery_time = hourly_patterns['avg_delivery_time'].mean()
-        hourly_patterns['traffic_condition'] = hourly_patterns['avg_delivery_time'].apply(
-            lambda x: 'Heavy' if x > avg_delivery_time * 1.2 
-                     else 'Moderate' if x > avg_delivery_time * 0.8 
-                     else 'Light'
+        hourly_delivery_time = hourly_patterns['avg_delivery_time'].to_numpy()
+        hourly_patterns['traffic_condition'] = pd.Categorical(
+            np.select(
+                [hourly_delivery_time > avg_delivery_time * 1.2,
+                 hourly_delivery_time > avg_delivery_time * 0.8],
+                ['Heavy', 'Moderate'],
+                default='Light'
+            ),
+            categories=['Light', 'Moderate', 'Heavy']
         )
         
         # Identify peak traffic hours
@@ -257,70 +466,101 @@ class DeliveryZoneMapper:
         
         return traffic_patterns
     
-    def calculate_zone_overlap(self):
+    def calculate_zone_overlap(self, delivery_zones=None):
         """
         Calculate overlap between delivery zones of different dark stores.
         
+        Only store pairs whose zones actually overlap are returned; the
+        result is empty when no two zones intersect.
+        
+        Args:
+            delivery_zones (dict): Precomputed output of generate_delivery_zones()
+            
         Returns:
             pd.DataFrame: Zone overlap analysis
         """
-        delivery_zones = self.generate_delivery_zones()
-        overlap_analysis = []
+        if delivery_zones is None:
+            delivery_zones = self.generate_delivery_zones()
         
         store_list = list(self.dark_stores.keys())
+        store_ids = np.array(store_list, dtype=object)
+        store_names = np.array([self.dark_stores[s]['name'] for s in store_list], dtype=object)
+        
+        # Distances between all store pairs in one vectorized pass
+        distance_matrix = self.calculate_pairwise_distances(store_list)
+        
+        # Average delivery radius for every store
+        radii = np.array([delivery_zones[s]['avg_radius'] for s in store_list], dtype=float)
+        
+        # Keep each unordered pair once, and only if the two zones intersect
+        i, j = np.triu_indices(len(store_list), k=1)
+        pair_distance = distance_matrix[i, j]
+        pair_radius_sum = radii[i] + radii[j]
+        overlapping = pair_distance < pair_radius_sum
+        i, j = i[overlapping], j[overlapping]
+        pair_distance = pair_distance[overlapping]
+        
+        # Overlap metrics for the overlapping pairs only
+        overlap_distance = pair_radius_sum[overlapping] - pair_distance
+        overlap_percentage = overlap_distance / np.minimum(radii[i], radii[j]) * 100
+        
+        return pd.DataFrame({
+            'store1': store_ids[i],
+            'store2': store_ids[j],
+            'store1_name': store_names[i],
+            'store2_name': store_names[j],
+            'distance_km': np.round(pair_distance, 2),
+            'store1_radius': radii[i],
+            'store2_radius': radii[j],
+            'overlap_exists': np.ones(len(i), dtype=bool),
+            'overlap_distance_km': np.round(overlap_distance, 2),
+            'overlap_percentage': np.round(overlap_percentage, 1)
+        })
+    
+    def build_zone_context(self):
+        """
+        Run each zone analysis once and bundle the results.
         
-        for i, store1 in enumerate(store_list):
-            for j, store2 in enumerate(store_list[i+1:], i+1):
-                store1_info = self.dark_stores[store1]
-                store2_info = self.dark_stores[store2]
-                
-                # Calculate distance between stores
-                distance = self.calculate_distance(
-                    store1_info['lat'], store1_info['lon'],
-                    store2_info['lat'], store2_info['lon']
-                )
-                
-                # Get average delivery radius for both stores
-                avg_radius1 = delivery_zones[store1]['avg_radius']
-                avg_radius2 = delivery_zones[store2]['avg_radius']
-                
-                # Calculate overlap
-                if distance < (avg_radius1 + avg_radius2):
-                    overlap_exists = True
-                    overlap_distance = (avg_radius1 + avg_radius2) - distance
-                    overlap_percentage = (overlap_distance / min(avg_radius1, avg_radius2)) * 100
-                else:
-                    overlap_exists = False
-                    overlap_distance = 0
-                    overlap_percentage = 0
-                
-                overlap_analysis.append({
-                    'store1': store1,
-                    'store2': store2,
-                    'store1_name': store1_info['name'],
-                    'store2_name': store2_info['name'],
-                    'distance_km': round(distance, 2),
-                    'store1_radius': avg_radius1,
-                    'store2_radius': avg_radius2,
-                    'overlap_exists': overlap_exists,
-                    'overlap_distance_km': round(overlap_distance, 2),
-                    'overlap_percentage': round(overlap_percentage, 1)
-                })
+        Returns:
+            ZoneContext: Performance, traffic, zone and overlap analysis
+        """
+        print("🗺️ Generating delivery zones...")
+        delivery_zones = self.generate_delivery_zones()
         
-        return pd.DataFrame(overlap_analysis)
+        print("📊 Analyzing delivery performance...")
+        performance_analysis = self.analyze_delivery_performance()
+        
+        print("🚦 Identifying traffic patterns...")
+        traffic_patterns = self.identify_traffic_patterns()
+        
+        print("🔄 Calculating zone overlaps...")
+        overlap_analysis = self.calculate_zone_overlap(delivery_zones)
+        
+        return ZoneContext(
+            performance=performance_analysis,
+            traffic=traffic_patterns,
+            zones=delivery_zones,
+            overlap=overlap_analysis
+        )
     
-    def recommend_zone_adjustments(self):
+    def recommend_zone_adjustments(self, context=None):
         """
         Recommend dynamic zone adjustments based on analysis.
         
+        Args:
+            context (ZoneContext): Precomputed analysis results; built with
+                build_zone_context() when not given
+            
         Returns:
             dict: Zone adjustment recommendations
         """
         # Get delivery performance and traffic patterns
-        performance = self.analyze_delivery_performance()
-        traffic_patterns = self.identify_traffic_patterns()
-        delivery_zones = self.generate_delivery_zones()
-        overlap_analysis = self.calculate_zone_overlap()
+        if context is None:
+            context = self.build_zone_context()
+        performance = context.performance
+        traffic_patterns = context.traffic
+        delivery_zones = context.zones
+        overlap_analysis = context.overlap
         
         recommendations = {
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -330,7 +570,7 @@ class DeliveryZoneMapper:
         }
         
         # Analyze performance by store - only for stores with data
-        store_performance = performance.groupby('dark_store_id').agg({
+        store_performance = performance.groupby('dark_store_id', observed=True).agg({
             'delivery_time_minutes_mean': 'mean',
             'success_rate': 'mean',
             'csat_score_mean': 'mean'
@@ -339,35 +579,39 @@ class DeliveryZoneMapper:
         # Only process stores that have performance data
         available_stores = store_performance.index.tolist()
         
+        store_ids = []
         for store_id in self.dark_stores.keys():
             if store_id not in available_stores:
                 print(f"⚠️ No performance data available for store {store_id} - skipping recommendations")
                 continue
-                
-            store_perf = store_performance.loc[store_id]
-            current_zones = delivery_zones[store_id]
-            
-            # Zone adjustment recommendations
-            if store_perf['delivery_time_minutes_mean'] > 18:
-                recommendations['zone_adjustments'].append({
-                    'store_id': store_id,
-                    'store_name': self.dark_stores[store_id]['name'],
-                    'current_avg_radius': current_zones['avg_radius'],
-                    'recommended_action': 'Reduce zone radius by 15%',
-                    'new_radius': round(current_zones['avg_radius'] * 0.85, 2),
-                    'reason': f"Average delivery time ({store_perf['delivery_time_minutes_mean']:.1f} min) exceeds target",
-                    'priority': 'High'
-                })
-            elif store_perf['delivery_time_minutes_mean'] < 10 and store_perf['success_rate'] > 0.9:
-                recommendations['zone_adjustments'].append({
-                    'store_id': store_id,
-                    'store_name': self.dark_stores[store_id]['name'],
-                    'current_avg_radius': current_zones['avg_radius'],
-                    'recommended_action': 'Expand zone radius by 20%',
-                    'new_radius': round(current_zones['avg_radius'] * 1.2, 2),
-                    'reason': f"Excellent performance allows for expansion",
-                    'priority': 'Medium'
-                })
+            store_ids.append(store_id)
+        
+        store_perf = store_performance.reindex(store_ids)
+        avg_delivery_time = store_perf['delivery_time_minutes_mean'].to_numpy()
+        success_rate = store_perf['success_rate'].to_numpy()
+        current_radius = np.array([delivery_zones[s]['avg_radius'] for s in store_ids], dtype=float)
+        
+        # Zone adjustment recommendations, decided for all stores at once
+        reduce_mask = avg_delivery_time > 18
+        expand_mask = ~reduce_mask & (avg_delivery_time < 10) & (success_rate > 0.9)
+        
+        adjustments = pd.DataFrame({
+            'store_id': store_ids,
+            'store_name': [self.dark_stores[s]['name'] for s in store_ids],
+            'current_avg_radius': current_radius,
+            'recommended_action': np.where(reduce_mask, 'Reduce zone radius by 15%', 'Expand zone radius by 20%'),
+            'new_radius': np.round(current_radius * np.where(reduce_mask, 0.85, 1.2), 2),
+            'reason': [
+                f"Average delivery time ({t:.1f} min) exceeds target" if reduce
+                else "Excellent performance allows for expansion"
+                for t, reduce in zip(avg_delivery_time, reduce_mask)
+            ],
+            'priority': np.where(reduce_mask, 'High', 'Medium')
+        })
+        
+        recommendations['zone_adjustments'].extend(
+            adjustments[reduce_mask | expand_mask].to_dict('records')
+        )
         
         # Operational recommendations based on traffic patterns
         peak_hours = traffic_patterns['peak_traffic_hours']
@@ -394,7 +638,7 @@ class DeliveryZoneMapper:
     
     def create_zone_mapping_report(self):
         """
-        Create a comprehensive delivery zone mapping report.
+        Load the data and create a comprehensive delivery zone mapping report.
         
         Returns:
             dict: Complete zone mapping analysis
@@ -402,27 +646,30 @@ class DeliveryZoneMapper:
         if not self.load_data():
             return None
         
-        print("🗺️ Generating delivery zones...")
-        delivery_zones = self.generate_delivery_zones()
-        
-        print("📊 Analyzing delivery performance...")
-        performance_analysis = self.analyze_delivery_performance()
+        return self.build_zone_mapping_report()
+    
+    def build_zone_mapping_report(self):
+        """
+        Create the delivery zone mapping report from the data already loaded.
         
-        print("🚦 Identifying traffic patterns...")
-        traffic_patterns = self.identify_traffic_patterns()
+        Returns:
+            dict: Complete zone mapping analysis
+        """
+        if self.sample_data is None:
+            print("❌ Please load data first using load_data()")
+            return None
         
-        print("🔄 Calculating zone overlaps...")
-        overlap_analysis = self.calculate_zone_overlap()
+        context = self.build_zone_context()
         
         print("💡 Generating recommendations...")
-        recommendations = self.recommend_zone_adjustments()
+        recommendations = self.recommend_zone_adjustments(context)
         
         zone_report = {
             'analysis_timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'delivery_zones': delivery_zones,
-            'performance_analysis': performance_analysis,
-            'traffic_patterns': traffic_patterns,
-            'overlap_analysis': overlap_analysis,
+            'delivery_zones': context.zones,
+            'performance_analysis': context.performance,
+            'traffic_patterns': context.traffic,
+            'overlap_analysis': context.overlap,
             'recommendations': recommendations
         }
         
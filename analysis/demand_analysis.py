@@ -12,9 +12,200 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import warnings
-warnings.filterwarnings('ignore')
+import os
+
+try:
+    import polars as pl
+except ImportError:
+    # Polars is optional; the pandas backend is used without it
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None  # CSVs are then parsed on every load, without a Parquet cache
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba is optional; without it the pandas groupby path is used instead
+    _HAS_NUMBA = False
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Column types for sample_data.csv; group keys are parsed as categoricals
+_SAMPLE_DTYPES = {
+    'category': 'category',
+    'dark_store_id': 'category',
+    'demand_quantity': 'int32',
+    'stock_available': 'int32',
+    'orders_fulfilled': 'int32',
+    'orders_cancelled': 'int32',
+    'delivery_time_minutes': 'float32',
+    'csat_score': 'float32'
+}
+
+# Part of the Parquet cache key: bump it whenever the cached columns or their
+# derivation change, so caches written by older code are rebuilt
+_PARQUET_CACHE_VERSION = 1
+
+@njit(cache=True)
+def _hour_category_kernel(hour, codes, demand, stock, fulfilled, cancelled, delivery, n_categories):
+    """
+    Accumulate per-(hour, category) sums over the rows in one linear pass.
+    
+    Cells are laid out hour-major, so cell = hour * n_categories + code.
+    Rows with a missing category (code -1) are skipped, and missing delivery
+    times are left out of the delivery total and count, as in groupby mean.
+    """
+    n_cells = 24 * n_categories
+    rows = np.zeros(n_cells, dtype=np.int64)
+    demand_sum = np.zeros(n_cells, dtype=np.int64)
+    fulfilled_sum = np.zeros(n_cells, dtype=np.int64)
+    cancelled_sum = np.zeros(n_cells, dtype=np.int64)
+    shortage_sum = np.zeros(n_cells, dtype=np.int64)
+    delivery_sum = np.zeros(n_cells, dtype=np.float64)
+    delivery_count = np.zeros(n_cells, dtype=np.int64)
+    
+    for i in range(hour.shape[0]):
+        if codes[i] < 0:
+            continue
+        cell = hour[i] * n_categories + codes[i]
+        rows[cell] += 1
+        demand_sum[cell] += demand[i]
+        fulfilled_sum[cell] += fulfilled[i]
+        cancelled_sum[cell] += cancelled[i]
+        shortage = demand[i] - stock[i]
+        if shortage > 0:
+            shortage_sum[cell] += shortage
+        if not np.isnan(delivery[i]):
+            delivery_sum[cell] += delivery[i]
+            delivery_count[cell] += 1
+    
+    return (rows, demand_sum, fulfilled_sum, cancelled_sum, shortage_sum,
+            delivery_sum, delivery_count)
+
+def warmup_jit():
+    """
+    Compile the Numba kernels ahead of the first analysis.
+    
+    The one-row inputs match the dtypes load_data produces, and category
+    codes arrive read-only, so the compiled specialization is the one real
+    calls reuse.
+    """
+    small = np.zeros(1, dtype=np.int32)
+    codes = np.zeros(1, dtype=np.int8)
+    codes.flags.writeable = False
+    _hour_category_kernel(
+        np.zeros(1, dtype=np.int8), codes,
+        small, small, small, small, np.zeros(1, dtype=np.float32), 1
+    )
+
+def _rate(numerator, denominator):
+    """
+    Elementwise numerator / denominator in one pass, with 0/0 giving 0.
+    
+    Equivalent to (numerator / denominator).fillna(0) without the
+    intermediate Series.
+    
+    Args:
+        numerator (pd.Series): Rate numerator
+        denominator (pd.Series): Rate denominator
+        
+    Returns:
+        np.ndarray: float64 rates
+    """
+    numerator = numerator.to_numpy(dtype=np.float64)
+    denominator = denominator.to_numpy(dtype=np.float64)
+    out = np.zeros(len(numerator))
+    with np.errstate(divide='ignore'):
+        np.divide(numerator, denominator, out=out, where=(numerator != 0) | (denominator != 0))
+    return out
+
+def _read_sample_csv(path):
+    """
+    Read sample_data.csv with typed columns, parsed timestamps and the
+    derived hour and day_of_week keys.
+    
+    Uses the multithreaded PyArrow CSV parser when pyarrow is installed and
+    falls back to the default C parser otherwise.
+    
+    Args:
+        path (str): Path to sample_data.csv
+        
+    Returns:
+        pd.DataFrame: Sample data with NumPy-backed columns
+    """
+    try:
+        data = pd.read_csv(path, engine='pyarrow', dtype=_SAMPLE_DTYPES, parse_dates=['timestamp'])
+    except ImportError:
+        data = pd.read_csv(path, dtype=_SAMPLE_DTYPES, parse_dates=['timestamp'])
+    return _add_time_keys(data)
+
+def _add_time_keys(data):
+    """
+    Add the int8 hour and day_of_week grouping keys from the timestamp.
+    
+    Args:
+        data (pd.DataFrame): Sample data with a parsed timestamp column
+        
+    Returns:
+        pd.DataFrame: The same frame with hour and day_of_week set
+    """
+    data['hour'] = data['timestamp'].dt.hour.astype(np.int8)
+    data['day_of_week'] = data['timestamp'].dt.dayofweek.astype(np.int8)
+    return data
+
+def _read_with_parquet_cache(csv_path, parse_csv, dtypes=None):
+    """
+    Read a CSV through a Parquet cache stored next to it.
+    
+    The first read parses the CSV with parse_csv and writes
+    <name>.demand.parquet, keeping the parsed dtypes. The file carries a
+    key of the cache version and the column types in its metadata; later
+    reads use it while it is newer than the CSV and its key matches, so a
+    file written by older code is rebuilt. The module suffix keeps this
+    cache apart from the ones other analysis modules write. Caching is
+    skipped when pyarrow is not installed.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+        parse_csv (callable): Function parsing the CSV into a DataFrame
+        dtypes (dict): Column types parse_csv applies, if any
+        
+    Returns:
+        pd.DataFrame: Parsed data
+    """
+    if pq is None:
+        return parse_csv(csv_path)
+    
+    parquet_path = f'{os.path.splitext(csv_path)[0]}.demand.parquet'
+    cache_key = f'{_PARQUET_CACHE_VERSION}:{sorted((dtypes or {}).items())}'.encode()
+    
+    if (os.path.exists(parquet_path) and
+            os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+        try:
+            if (pq.read_schema(parquet_path).metadata or {}).get(b'cache_key') == cache_key:
+                return pd.read_parquet(parquet_path)
+        except (OSError, ValueError, pa.ArrowException):
+            pass  # Fall back to the CSV below
+    
+    data = parse_csv(csv_path)
+    
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, b'cache_key': cache_key})
+        pq.write_table(table, parquet_path, compression='snappy')
+    except (OSError, ValueError, pa.ArrowException):
+        pass  # Caching is best effort; the parsed CSV is still usable
+    
+    return data
 
 class DemandAnalyzer:
     """
@@ -28,37 +219,75 @@ class DemandAnalyzer:
     - Generate actionable insights for inventory optimization
     """
     
-    def __init__(self, data_path='../data/'):
+    def __init__(self, data_path='../data/', backend='pandas'):
         """
         Initialize the DemandAnalyzer with data path.
         
         Args:
             data_path (str): Path to the data directory
+            backend (str): 'pandas', or 'polars' to run the hour/category
+                aggregation on Polars when it is installed
         """
         self.data_path = data_path
+        self.backend = backend
         self.sample_data = None
-        self.demand_patterns = None
-        self.inventory_data = None
+        self._demand_patterns = None
+        self._inventory_data = None
+        self._groupers = {}
+        self._hour_category_summary = None
+        self._analysis = None
+        self._bottlenecks = None
+        self._metrics = None
         
     def load_data(self):
         """
         Load all required datasets for demand analysis.
         
+        Only the sample data is read here; demand_patterns and
+        inventory_data are read on first access.
+        
         Returns:
             bool: True if all data loaded successfully, False otherwise
         """
         try:
             # Load sample transaction data
-            self.sample_data = pd.read_csv(f'{self.data_path}sample_data.csv')
-            self.sample_data['timestamp'] = pd.to_datetime(self.sample_data['timestamp'])
-            self.sample_data['hour'] = self.sample_data['timestamp'].dt.hour
-            self.sample_data['day_of_week'] = self.sample_data['timestamp'].dt.dayofweek
+            self.sample_data = _read_with_parquet_cache(
+                f'{self.data_path}sample_data.csv', _read_sample_csv, _SAMPLE_DTYPES
+            )
             
-            # Load demand patterns
-            self.demand_patterns = pd.read_csv(f'{self.data_path}demand_patterns.csv')
+            # Reference tables are re-read lazily for the new data path
+            self._demand_patterns = None
+            self._inventory_data = None
+            self._reset_results()
+            
+            print("✅ All data loaded successfully!")
+            return True
             
-            # Load inventory data
-            self.inventory_data = pd.read_csv(f'{self.data_path}inventory_data.csv')
+        except Exception as e:
+            print(f"❌ Error loading data: {str(e)}")
+            return False
+    
+    def load_frames(self, frames):
+        """
+        Load datasets from DataFrames the caller has already read.
+        
+        Lets several analyzers share a single parse of the CSVs. The sample
+        data is cast to this module's dtypes on a new frame, so the derived
+        columns never leak back into the shared one.
+        
+        Args:
+            frames (dict): 'sample_data', 'demand_patterns' and
+                'inventory_data' DataFrames; sample_data needs a parsed
+                timestamp column
+                
+        Returns:
+            bool: True if all data loaded successfully, False otherwise
+        """
+        try:
+            self.sample_data = _add_time_keys(frames['sample_data'].astype(_SAMPLE_DTYPES))
+            self._demand_patterns = frames['demand_patterns']
+            self._inventory_data = frames['inventory_data']
+            self._reset_results()
             
             print("✅ All data loaded successfully!")
             return True
@@ -67,85 +296,370 @@ class DemandAnalyzer:
             print(f"❌ Error loading data: {str(e)}")
             return False
     
-    def analyze_demand_patterns(self):
+    def _reset_results(self):
+        """Drop cached groupers, aggregations and results of the previous data."""
+        self._groupers = {}
+        self._hour_category_summary = None
+        self._analysis = None
+        self._bottlenecks = None
+        self._metrics = None
+    
+    @property
+    def demand_patterns(self):
         """
-        Analyze demand patterns across different dimensions.
+        Demand patterns table, read from demand_patterns.csv on first access.
         
         Returns:
-            dict: Dictionary containing various demand analysis results
+            pd.DataFrame: Demand patterns
         """
-        if self.sample_data is None:
-            print("❌ Please load data first using load_data()")
-            return None
+        if self._demand_patterns is None:
+            self._demand_patterns = _read_with_parquet_cache(
+                f'{self.data_path}demand_patterns.csv', pd.read_csv
+            )
+        return self._demand_patterns
+    
+    @property
+    def inventory_data(self):
+        """
+        Inventory table, read from inventory_data.csv on first access.
         
-        analysis_results = {}
+        Returns:
+            pd.DataFrame: Inventory data
+        """
+        if self._inventory_data is None:
+            self._inventory_data = _read_with_parquet_cache(
+                f'{self.data_path}inventory_data.csv', pd.read_csv
+            )
+        return self._inventory_data
+    
+    def _col(self, name):
+        """
+        Zero-copy NumPy view of a sample data column.
+        
+        Args:
+            name (str): Column name
+            
+        Returns:
+            np.ndarray: Column values
+        """
+        return self.sample_data[name].to_numpy(copy=False)
+    
+    def _ensure_stock_shortage(self):
+        """
+        Add the stock_shortage column to the sample data if it is missing.
+        """
+        if 'stock_shortage' not in self.sample_data.columns:
+            # Subtract and clip in one int32 buffer instead of chaining temporaries
+            shortage = np.subtract(
+                self._col('demand_quantity'),
+                self._col('stock_available'),
+                dtype=np.int32
+            )
+            np.maximum(shortage, 0, out=shortage)
+            self.sample_data['stock_shortage'] = shortage
+    
+    def _groupby(self, keys):
+        """
+        Return a cached observed=True groupby of the sample data.
         
-        # 1. Hourly demand analysis
-        hourly_demand = self.sample_data.groupby(['hour', 'category']).agg({
+        The grouper (key codes and indexer) is built once per key set and
+        reused by every aggregation until the data is reloaded.
+        
+        Args:
+            keys (str or list): Column(s) to group by
+            
+        Returns:
+            pd.core.groupby.DataFrameGroupBy: Grouped sample data
+        """
+        cache_key = tuple(keys) if isinstance(keys, list) else keys
+        if cache_key not in self._groupers:
+            # Derived columns must exist before a grouper captures the frame
+            self._ensure_stock_shortage()
+            self._groupers[cache_key] = self.sample_data.groupby(keys, observed=True)
+        return self._groupers[cache_key]
+    
+    def summarize_by_hour_and_category(self):
+        """
+        Aggregate the sample data per (hour, category) in a single groupby pass.
+        
+        The result feeds the hourly demand, out-of-stock and bottleneck
+        analyses and is cached until the data is reloaded.
+        
+        Returns:
+            pd.DataFrame: Demand, orders, shortage and delivery time per hour and category
+        """
+        if self._hour_category_summary is not None:
+            return self._hour_category_summary
+        
+        self._ensure_stock_shortage()
+        
+        if self.backend == 'polars' and pl is not None:
+            self._hour_category_summary = self._summarize_with_polars()
+            return self._hour_category_summary
+        
+        if _HAS_NUMBA:
+            self._hour_category_summary = self._summarize_with_kernel()
+            return self._hour_category_summary
+        
+        self._hour_category_summary = self._groupby(['hour', 'category']).agg({
             'demand_quantity': 'sum',
             'orders_fulfilled': 'sum',
-            'orders_cancelled': 'sum'
+            'orders_cancelled': 'sum',
+            'stock_shortage': 'sum',
+            'delivery_time_minutes': 'mean'
         }).reset_index()
         
-        hourly_demand['fulfillment_rate'] = (
-            hourly_demand['orders_fulfilled'] / 
-            (hourly_demand['orders_fulfilled'] + hourly_demand['orders_cancelled'])
-        ).fillna(0)
+        return self._hour_category_summary
+    
+    def _summarize_with_kernel(self):
+        """
+        Numba version of the (hour, category) aggregation.
         
-        analysis_results['hourly_demand'] = hourly_demand
+        Returns:
+            pd.DataFrame: Same columns, dtypes and row order as the pandas groupby
+        """
+        data = self.sample_data
+        category_dtype = data['category'].dtype
+        n_categories = len(category_dtype.categories)
+        
+        (rows, demand_sum, fulfilled_sum, cancelled_sum, shortage_sum,
+         delivery_sum, delivery_count) = _hour_category_kernel(
+            self._col('hour'),
+            data['category'].cat.codes.to_numpy(),
+            self._col('demand_quantity'),
+            self._col('stock_available'),
+            self._col('orders_fulfilled'),
+            self._col('orders_cancelled'),
+            self._col('delivery_time_minutes'),
+            n_categories
+        )
         
-        # 2. Product category analysis
-        category_analysis = self.sample_data.groupby('category').agg({
-            'demand_quantity': ['sum', 'mean', 'std'],
-            'orders_fulfilled': 'sum',
-            'orders_cancelled': 'sum',
-            'delivery_time_minutes': 'mean',
-            'csat_score': 'mean'
-        }).round(2)
+        # Observed cells only, already in (hour, category) sort order
+        cells = np.flatnonzero(rows)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delivery_mean = delivery_sum[cells] / delivery_count[cells]
+        
+        return pd.DataFrame({
+            'hour': (cells // n_categories).astype(data['hour'].dtype),
+            'category': pd.Categorical.from_codes(cells % n_categories, dtype=category_dtype),
+            'demand_quantity': demand_sum[cells].astype(np.int32),
+            'orders_fulfilled': fulfilled_sum[cells].astype(np.int32),
+            'orders_cancelled': cancelled_sum[cells].astype(np.int32),
+            'stock_shortage': shortage_sum[cells].astype(np.int32),
+            'delivery_time_minutes': delivery_mean.astype(data['delivery_time_minutes'].dtype)
+        })
+    
+    def _summarize_with_polars(self):
+        """
+        Polars version of the (hour, category) aggregation.
         
-        category_analysis.columns = ['_'.join(col).strip() for col in category_analysis.columns.values]
-        analysis_results['category_analysis'] = category_analysis
+        Returns:
+            pd.DataFrame: Same columns, dtypes and row order as the pandas groupby
+        """
+        columns = ['hour', 'category', 'demand_quantity', 'orders_fulfilled',
+                   'orders_cancelled', 'stock_shortage', 'delivery_time_minutes']
+        summary = (
+            pl.from_pandas(self.sample_data[columns])
+            .lazy()
+            .with_columns(pl.col('category').cast(pl.Utf8))
+            .group_by(['hour', 'category'])
+            .agg([
+                pl.col('demand_quantity').sum(),
+                pl.col('orders_fulfilled').sum(),
+                pl.col('orders_cancelled').sum(),
+                pl.col('stock_shortage').sum(),
+                pl.col('delivery_time_minutes').mean()
+            ])
+            .sort(['hour', 'category'])
+            .collect()
+            .to_pandas()
+        )
+        summary['category'] = summary['category'].astype(self.sample_data['category'].dtype)
+        return summary
+    
+    def _analyze_hourly_demand(self, hour_category):
+        """
+        Demand and fulfillment rate per hour and category.
         
-        # 3. Peak hours identification
-        peak_hours = self.sample_data.groupby('hour')['demand_quantity'].sum().sort_values(ascending=False)
-        analysis_results['peak_hours'] = peak_hours.head(5)
+        Args:
+            hour_category (pd.DataFrame): Output of summarize_by_hour_and_category
+            
+        Returns:
+            pd.DataFrame: Hourly demand by category
+        """
+        hourly_demand = hour_category[
+            ['hour', 'category', 'demand_quantity', 'orders_fulfilled', 'orders_cancelled']
+        ].copy()
         
-        # 4. Out-of-stock analysis
-        self.sample_data['stock_shortage'] = np.maximum(
-            0, self.sample_data['demand_quantity'] - self.sample_data['stock_available']
+        hourly_demand['fulfillment_rate'] = _rate(
+            hourly_demand['orders_fulfilled'],
+            hourly_demand['orders_fulfilled'] + hourly_demand['orders_cancelled']
         )
         
-        oos_analysis = self.sample_data.groupby(['category', 'hour']).agg({
-            'stock_shortage': 'sum',
-            'demand_quantity': 'sum'
-        }).reset_index()
+        return hourly_demand
+    
+    def _analyze_categories(self):
+        """
+        Demand, order, delivery and CSAT summary per product category.
         
-        oos_analysis['oos_rate'] = (oos_analysis['stock_shortage'] / oos_analysis['demand_quantity']).fillna(0)
-        analysis_results['oos_analysis'] = oos_analysis
+        Returns:
+            pd.DataFrame: Category analysis with '<column>_<func>' columns
+        """
+        # Named aggregation yields the flat '<column>_<func>' names directly
+        return self._groupby('category').agg(
+            demand_quantity_sum=('demand_quantity', 'sum'),
+            demand_quantity_mean=('demand_quantity', 'mean'),
+            demand_quantity_std=('demand_quantity', 'std'),
+            orders_fulfilled_sum=('orders_fulfilled', 'sum'),
+            orders_cancelled_sum=('orders_cancelled', 'sum'),
+            delivery_time_minutes_mean=('delivery_time_minutes', 'mean'),
+            csat_score_mean=('csat_score', 'mean')
+        )
+    
+    def _analyze_peak_hours(self):
+        """
+        Top five hours by total demand.
         
-        # 5. Dark store performance comparison
-        store_performance = self.sample_data.groupby('dark_store_id').agg({
-            'orders_fulfilled': 'sum',
-            'orders_cancelled': 'sum',
-            'delivery_time_minutes': 'mean',
-            'csat_score': 'mean'
-        }).round(2)
+        Hours are small integers, so the per-hour totals come from one
+        np.bincount instead of a groupby.
+        
+        Returns:
+            pd.Series: Demand per hour, highest first
+        """
+        hour = self._col('hour')
+        demand = np.bincount(hour, weights=self._col('demand_quantity'), minlength=24)
+        observed = np.flatnonzero(np.bincount(hour, minlength=24))
+        
+        peak_hours = pd.Series(
+            demand[observed].astype(np.int64),
+            index=pd.Index(observed.astype(hour.dtype), name='hour'),
+            name='demand_quantity'
+        ).sort_values(ascending=False)
+        return peak_hours.head(5)
+    
+    def _analyze_out_of_stock(self, hour_category):
+        """
+        Stock shortage and out-of-stock rate per category and hour.
+        
+        Args:
+            hour_category (pd.DataFrame): Output of summarize_by_hour_and_category
+            
+        Returns:
+            pd.DataFrame: Out-of-stock analysis sorted by category and hour
+        """
+        oos_analysis = hour_category[
+            ['category', 'hour', 'stock_shortage', 'demand_quantity']
+        ].sort_values(['category', 'hour']).reset_index(drop=True)
+        
+        oos_analysis['oos_rate'] = _rate(oos_analysis['stock_shortage'], oos_analysis['demand_quantity'])
+        return oos_analysis
+    
+    def _analyze_store_performance(self):
+        """
+        Order, delivery and CSAT summary per dark store.
+        
+        Sums and means are taken with np.bincount over the dark_store_id
+        category codes instead of a groupby.
+        
+        Returns:
+            pd.DataFrame: Store performance with total orders and fulfillment rate
+        """
+        store_dtype = self.sample_data['dark_store_id'].dtype
+        n_stores = len(store_dtype.categories)
+        codes = self.sample_data['dark_store_id'].cat.codes.to_numpy()
+        columns = {
+            name: self._col(name)
+            for name in ['orders_fulfilled', 'orders_cancelled', 'delivery_time_minutes', 'csat_score']
+        }
+        
+        # Rows without a store id (code -1) are left out, as in groupby
+        has_store = codes >= 0
+        if not has_store.all():
+            codes = codes[has_store]
+            columns = {name: values[has_store] for name, values in columns.items()}
+        
+        observed = np.flatnonzero(np.bincount(codes, minlength=n_stores))
+        
+        def store_sum(values):
+            return np.bincount(codes, weights=values, minlength=n_stores)[observed].astype(np.int64)
+        
+        def store_mean(values):
+            # Skip missing values, as groupby mean does
+            present = ~np.isnan(values)
+            totals = np.bincount(codes[present], weights=values[present], minlength=n_stores)
+            counts = np.bincount(codes[present], minlength=n_stores)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return (totals[observed] / counts[observed]).astype(values.dtype)
+        
+        store_performance = pd.DataFrame(
+            {
+                'orders_fulfilled': store_sum(columns['orders_fulfilled']),
+                'orders_cancelled': store_sum(columns['orders_cancelled']),
+                'delivery_time_minutes': store_mean(columns['delivery_time_minutes']),
+                'csat_score': store_mean(columns['csat_score'])
+            },
+            index=pd.CategoricalIndex(
+                pd.Categorical.from_codes(observed, dtype=store_dtype), name='dark_store_id'
+            )
+        )
         
         store_performance['total_orders'] = (
             store_performance['orders_fulfilled'] + store_performance['orders_cancelled']
         )
         store_performance['fulfillment_rate'] = (
             store_performance['orders_fulfilled'] / store_performance['total_orders']
-        ).round(3)
+        )
         
-        analysis_results['store_performance'] = store_performance
+        return store_performance
+    
+    def analyze_demand_patterns(self):
+        """
+        Analyze demand patterns across different dimensions.
+        
+        The five views are computed concurrently on a thread pool, since the
+        pandas and NumPy kernels behind them release the GIL. The result is
+        cached until the data is reloaded.
+        
+        Returns:
+            dict: Dictionary containing various demand analysis results
+        """
+        if self.sample_data is None:
+            print("❌ Please load data first using load_data()")
+            return None
         
+        if self._analysis is not None:
+            return self._analysis
+        
+        # One shared (hour, category) aggregation for the hourly and out-of-stock views
+        hour_category = self.summarize_by_hour_and_category()
+        
+        # Build the shared grouper up front so worker threads only read it
+        self._groupby('category')
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                # 1. Hourly demand analysis
+                'hourly_demand': executor.submit(self._analyze_hourly_demand, hour_category),
+                # 2. Product category analysis
+                'category_analysis': executor.submit(self._analyze_categories),
+                # 3. Peak hours identification
+                'peak_hours': executor.submit(self._analyze_peak_hours),
+                # 4. Out-of-stock analysis
+                'oos_analysis': executor.submit(self._analyze_out_of_stock, hour_category),
+                # 5. Dark store performance comparison
+                'store_performance': executor.submit(self._analyze_store_performance)
+            }
+            analysis_results = {name: future.result() for name, future in futures.items()}
+        
+        self._analysis = analysis_results
         return analysis_results
     
     def identify_bottlenecks(self):
         """
         Identify key bottlenecks in the system.
         
+        The result is cached until the data is reloaded.
+        
         Returns:
             dict: Dictionary containing bottleneck analysis
         """
@@ -153,20 +667,24 @@ class DemandAnalyzer:
             print("❌ Please load data first using load_data()")
             return None
         
+        if self._bottlenecks is not None:
+            return self._bottlenecks
+        
         bottlenecks = {}
         
+        hour_category = self.summarize_by_hour_and_category()
+        
         # 1. High cancellation rate periods
-        cancellation_analysis = self.sample_data.groupby(['hour', 'category']).agg({
-            'orders_cancelled': 'sum',
-            'orders_fulfilled': 'sum'
-        }).reset_index()
+        cancellation_analysis = hour_category[
+            ['hour', 'category', 'orders_cancelled', 'orders_fulfilled']
+        ].copy()
         
         cancellation_analysis['total_orders'] = (
             cancellation_analysis['orders_cancelled'] + cancellation_analysis['orders_fulfilled']
         )
-        cancellation_analysis['cancellation_rate'] = (
-            cancellation_analysis['orders_cancelled'] / cancellation_analysis['total_orders']
-        ).fillna(0)
+        cancellation_analysis['cancellation_rate'] = _rate(
+            cancellation_analysis['orders_cancelled'], cancellation_analysis['total_orders']
+        )
         
         high_cancellation = cancellation_analysis[
             cancellation_analysis['cancellation_rate'] > 0.2
@@ -175,9 +693,7 @@ class DemandAnalyzer:
         bottlenecks['high_cancellation_periods'] = high_cancellation
         
         # 2. Long delivery time periods
-        delivery_time_analysis = self.sample_data.groupby(['hour', 'category']).agg({
-            'delivery_time_minutes': 'mean'
-        }).reset_index()
+        delivery_time_analysis = hour_category[['hour', 'category', 'delivery_time_minutes']]
         
         slow_delivery = delivery_time_analysis[
             delivery_time_analysis['delivery_time_minutes'] > 20
@@ -185,22 +701,25 @@ class DemandAnalyzer:
         
         bottlenecks['slow_delivery_periods'] = slow_delivery
         
-        # 3. Low customer satisfaction periods
-        low_csat = self.sample_data[
-            self.sample_data['csat_score'] < 3.5
-        ].groupby(['hour', 'category']).agg({
-            'csat_score': 'mean',
-            'orders_fulfilled': 'count'
-        }).reset_index().sort_values('csat_score')
+        # 3. Low customer satisfaction periods: average CSAT below 3.5
+        csat_by_period = self._groupby(['hour', 'category']).agg(
+            csat_score=('csat_score', 'mean'),
+            orders_fulfilled=('orders_fulfilled', 'count')
+        ).reset_index()
+        
+        low_csat = csat_by_period[csat_by_period['csat_score'] < 3.5].sort_values('csat_score')
         
         bottlenecks['low_satisfaction_periods'] = low_csat
         
+        self._bottlenecks = bottlenecks
         return bottlenecks
     
     def calculate_key_metrics(self):
         """
         Calculate key performance metrics for the system.
         
+        The result is cached until the data is reloaded.
+        
         Returns:
             dict: Dictionary containing key metrics
         """
@@ -208,12 +727,19 @@ class DemandAnalyzer:
             print("❌ Please load data first using load_data()")
             return None
         
+        # Derive stock_shortage first, so the cached out-of-stock rate does not
+        # depend on whether another analysis has already added the column
+        self._ensure_stock_shortage()
+        
+        if self._metrics is not None:
+            return self._metrics
+        
         metrics = {}
         
-        # Overall metrics
-        total_demand = self.sample_data['demand_quantity'].sum()
-        total_fulfilled = self.sample_data['orders_fulfilled'].sum()
-        total_cancelled = self.sample_data['orders_cancelled'].sum()
+        # Overall metrics; counts accumulate in int64 so int32 columns cannot overflow
+        total_demand = int(np.add.reduce(self._col('demand_quantity'), dtype=np.int64))
+        total_fulfilled = int(np.add.reduce(self._col('orders_fulfilled'), dtype=np.int64))
+        total_cancelled = int(np.add.reduce(self._col('orders_cancelled'), dtype=np.int64))
         
         metrics['total_demand'] = total_demand
         metrics['total_fulfilled'] = total_fulfilled
@@ -223,41 +749,39 @@ class DemandAnalyzer:
         
         # Out-of-stock metrics
         if 'stock_shortage' in self.sample_data.columns:
-            total_shortage = self.sample_data['stock_shortage'].sum()
+            total_shortage = int(np.add.reduce(self._col('stock_shortage'), dtype=np.int64))
         else:
             # Fallback: estimate from cancellations
-            total_shortage = self.sample_data['orders_cancelled'].sum() * 0.6
-            
-        if 'demand_quantity' in self.sample_data.columns:
-            total_demand = self.sample_data['demand_quantity'].sum()
-        else:
-            total_demand = self.sample_data['orders_fulfilled'].sum() + self.sample_data['orders_cancelled'].sum()
-
+            total_shortage = total_cancelled * 0.6
+        
         metrics['out_of_stock_rate'] = total_shortage / total_demand if total_demand > 0 else 0.25
         
-        # Delivery performance
-        metrics['avg_delivery_time'] = round(self.sample_data['delivery_time_minutes'].mean(), 1)
-        metrics['delivery_time_std'] = round(self.sample_data['delivery_time_minutes'].std(), 1)
+        # Delivery performance (NaN-skipping, sample std, as in pandas)
+        delivery = self._col('delivery_time_minutes')
+        metrics['avg_delivery_time'] = round(float(np.nanmean(delivery, dtype=np.float64)), 1)
+        metrics['delivery_time_std'] = round(float(np.nanstd(delivery, dtype=np.float64, ddof=1)), 1)
         
         # Customer satisfaction
-        metrics['avg_csat_score'] = round(self.sample_data['csat_score'].mean(), 2)
-        metrics['csat_below_3'] = len(self.sample_data[self.sample_data['csat_score'] < 3]) / len(self.sample_data)
+        csat = self._col('csat_score')
+        metrics['avg_csat_score'] = round(float(np.nanmean(csat, dtype=np.float64)), 2)
+        metrics['csat_below_3'] = np.count_nonzero(csat < 3) / csat.size
         
         # Performance by category
-        category_metrics = self.sample_data.groupby('category').agg({
+        category_metrics = self._groupby('category').agg({
             'orders_fulfilled': 'sum',
             'orders_cancelled': 'sum',
             'delivery_time_minutes': 'mean',
             'csat_score': 'mean'
-        }).round(2)
+        })
         
         category_metrics['fulfillment_rate'] = (
             category_metrics['orders_fulfilled'] / 
             (category_metrics['orders_fulfilled'] + category_metrics['orders_cancelled'])
-        ).round(3)
+        )
         
         metrics['category_performance'] = category_metrics
         
+        self._metrics = metrics
         return metrics
     
     def generate_insights(self):
@@ -273,9 +797,8 @@ class DemandAnalyzer:
         
         insights = []
         
-        # Analyze the data for insights
+        # Reuses any results already computed for the loaded data
         analysis = self.analyze_demand_patterns()
-        bottlenecks = self.identify_bottlenecks()
         metrics = self.calculate_key_metrics()
         
         # Generate insights based on analysis
@@ -308,7 +831,7 @@ class DemandAnalyzer:
         insights.append({
             'type': 'Opportunity',
             'category': 'Demand',
-            'insight': f"Peak demand hours are {list(peak_hours.head(3).index)} with potential for optimization",
+            'insight': f"Peak demand hours are {peak_hours.index[:3].tolist()} with potential for optimization",
             'recommendation': 'Pre-position inventory and increase staffing during these hours'
         })
         
@@ -10,15 +10,197 @@ Date: 2024
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error, mean_squared_error
-from sklearn.preprocessing import StandardScaler
+import hashlib
+import os
+from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain NumPy
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import joblib
+except ImportError:
+    joblib = None  # Trained models are then not cached between runs
+
+# Column types for the raw CSVs: counts fit in int32, fractional values in float32
+_SAMPLE_DTYPES = {
+    'category': 'category',
+    'dark_store_id': 'category',
+    'demand_quantity': 'int32',
+    'stock_available': 'int32',
+    'orders_fulfilled': 'int32',
+    'orders_cancelled': 'int32',
+    'delivery_time_minutes': 'float32',
+    'csat_score': 'float32'
+}
+
+_INVENTORY_DTYPES = {
+    'current_stock': 'int32',
+    'min_stock_level': 'int32',
+    'max_stock_level': 'int32',
+    'reorder_point': 'int32',
+    'lead_time_hours': 'int32',
+    'supplier_reliability': 'float32',
+    'storage_cost_per_unit': 'float32',
+    'shelf_life_days': 'int32'
+}
+
+# Trained forecasting models are cached in this one file, which each retrain
+# replaces. _MODEL_VERSION is part of the cache key: bump it whenever the
+# model fit or its hyperparameters change, so cached models are retrained
+_MODEL_CACHE_PATH = os.path.join('cache', 'forecast_models.joblib')
+_MODEL_VERSION = 1
+
+# Restocking urgency levels, least urgent first; urgency score = code + 1
+_URGENCY_DTYPE = pd.CategoricalDtype(['Low', 'Medium', 'High', 'Critical'], ordered=True)
+
+# Cyclical time features for every hour of the day and day of the week, indexed by value
+_HOUR_ANGLES = np.float32(2 * np.pi / 24) * np.arange(24, dtype=np.float32)
+_DAY_ANGLES = np.float32(2 * np.pi / 7) * np.arange(7, dtype=np.float32)
+_HOUR_SIN, _HOUR_COS = np.sin(_HOUR_ANGLES), np.cos(_HOUR_ANGLES)
+_DAY_SIN, _DAY_COS = np.sin(_DAY_ANGLES), np.cos(_DAY_ANGLES)
+
+def _read_csv(path, **kwargs):
+    """
+    Read a CSV with the multithreaded pyarrow parser when it is installed.
+    
+    Args:
+        path (str): Path to the CSV file
+        **kwargs: Further pd.read_csv arguments
+        
+    Returns:
+        pd.DataFrame: Parsed data
+    """
+    try:
+        return pd.read_csv(path, engine='pyarrow', **kwargs)
+    except ImportError:
+        return pd.read_csv(path, **kwargs)
+
+@njit(cache=True)
+def _stock_level_kernel(avg_demand, demand_std, lead_time, storage_cost, z_score, order_cost):
+    """
+    Safety stock, EOQ, reorder point and max stock for arrays of items.
+    
+    Missing or zero demand deviations fall back to 20% of average demand,
+    and items without a holding cost order a week of average demand.
+    """
+    demand_std = np.where(demand_std > 0, demand_std, avg_demand * 0.2)
+    lead_days = lead_time / 24  # Convert to daily
+    
+    safety_stock = z_score * demand_std * np.sqrt(lead_days)
+    
+    # Economic Order Quantity approximation with a 20% holding cost
+    holding_cost = storage_cost * 0.2
+    annual_demand = avg_demand * 365
+    eoq = np.where(
+        holding_cost > 0,
+        np.sqrt((2 * annual_demand * order_cost) / holding_cost),
+        avg_demand * 7
+    )
+    
+    reorder_point = avg_demand * lead_days + safety_stock
+    max_stock = reorder_point + eoq
+    return safety_stock, eoq, reorder_point, max_stock
+
+@njit(cache=True)
+def _inventory_cost_kernel(current_stock, storage_cost, avg_demand, lost_sale_cost):
+    """
+    Daily holding, stockout and total cost for arrays of items.
+    
+    Holding cost uses a 20% annual rate on the storage cost; stockout cost
+    charges lost_sale_cost for the expected shortfall, and is zero for
+    items without demand.
+    """
+    holding_cost = current_stock * storage_cost * 0.2 / 365
+    
+    has_demand = avg_demand > 0
+    safe_demand = np.where(has_demand, avg_demand, 1.0)
+    stockout_probability = np.where(
+        has_demand, np.maximum(0.0, (avg_demand - current_stock) / safe_demand), 0.0
+    )
+    stockout_cost = stockout_probability * avg_demand * lost_sale_cost
+    return holding_cost, stockout_cost, holding_cost + stockout_cost
+
+def warmup_jit():
+    """Compile the Numba kernels ahead of the first optimization run."""
+    ones = np.ones(1)
+    _stock_level_kernel(ones, ones, ones, ones, 1.65, 50.0)
+    _inventory_cost_kernel(ones, ones, ones, 5.0)
+
+def _fit_linear_batch(designs, targets):
+    """
+    Ordinary least squares fits for several independent datasets at once.
+    
+    Each dataset is standardized and centered, zero-padded to a common row
+    count (padded rows do not change a least-squares solution) and solved
+    with one stacked pseudo-inverse. Standardizing first makes the
+    minimum-norm solution picked for rank-deficient data (few rows per
+    category, constant columns) match StandardScaler + LinearRegression.
+    The coefficients are folded back to the raw feature scale.
+    
+    Args:
+        designs (list): Feature matrices of shape (n_k, n_features)
+        targets (list): Target vectors of shape (n_k,)
+        
+    Returns:
+        np.ndarray: Shape (len(designs), n_features + 1); intercept first
+    """
+    n_rows = np.array([len(y) for y in targets])
+    n_features = designs[0].shape[1]
+    
+    X = np.zeros((len(designs), n_rows.max(), n_features))
+    y = np.zeros((len(designs), n_rows.max()))
+    mask = np.arange(n_rows.max()) < n_rows[:, None]
+    for k, (design, target) in enumerate(zip(designs, targets)):
+        X[k, :n_rows[k]] = design
+        y[k, :n_rows[k]] = target
+    
+    x_mean = X.sum(axis=1) / n_rows[:, None]
+    x_scale = np.sqrt((((X - x_mean[:, None, :]) * mask[..., None]) ** 2).sum(axis=1) / n_rows[:, None])
+    x_scale[x_scale == 0] = 1.0  # Constant columns stay unscaled, as in StandardScaler
+    y_mean = y.sum(axis=1) / n_rows
+    
+    X_std = (X - x_mean[:, None, :]) / x_scale[:, None, :] * mask[..., None]
+    y_centered = (y - y_mean[:, None]) * mask
+    
+    coef = (np.linalg.pinv(X_std) @ y_centered[..., None])[..., 0] / x_scale
+    intercept = y_mean - np.einsum('kp,kp->k', x_mean, coef)
+    return np.column_stack([intercept, coef])
+
+def _data_fingerprint(data):
+    """
+    Short content hash of a DataFrame, independent of its index.
+    
+    Args:
+        data (pd.DataFrame): Data to fingerprint
+        
+    Returns:
+        str: Hex digest
+    """
+    row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+def _predict_linear(theta, X):
+    """
+    Predict with one coefficient row from _fit_linear_batch.
+    
+    Args:
+        theta (np.ndarray): Intercept followed by feature coefficients
+        X (np.ndarray): Feature matrix of shape (n_samples, n_features)
+        
+    Returns:
+        np.ndarray: Predictions
+    """
+    return theta[0] + np.asarray(X, dtype=np.float64) @ theta[1:]
+
 class InventoryOptimizer:
     """
     Advanced inventory optimization class for Flipkart Minutes.
@@ -53,13 +235,16 @@ class InventoryOptimizer:
         """
         try:
             # Load datasets
-            self.sample_data = pd.read_csv(f'{self.data_path}sample_data.csv')
-            self.sample_data['timestamp'] = pd.to_datetime(self.sample_data['timestamp'])
-            self.sample_data['hour'] = self.sample_data['timestamp'].dt.hour
-            self.sample_data['day_of_week'] = self.sample_data['timestamp'].dt.dayofweek
+            self.sample_data = self._add_time_keys(_read_csv(
+                f'{self.data_path}sample_data.csv',
+                dtype=_SAMPLE_DTYPES,
+                parse_dates=['timestamp']
+            ))
             
-            self.demand_patterns = pd.read_csv(f'{self.data_path}demand_patterns.csv')
-            self.inventory_data = pd.read_csv(f'{self.data_path}inventory_data.csv')
+            self.demand_patterns = _read_csv(f'{self.data_path}demand_patterns.csv')
+            self.inventory_data = _read_csv(
+                f'{self.data_path}inventory_data.csv', dtype=_INVENTORY_DTYPES
+            )
             
             print("✅ All data loaded successfully!")
             return True
@@ -68,6 +253,51 @@ class InventoryOptimizer:
             print(f"❌ Error loading data: {str(e)}")
             return False
     
+    def load_frames(self, frames):
+        """
+        Load datasets from DataFrames the caller has already read.
+        
+        Lets several analyzers share a single parse of the CSVs. Frames are
+        cast to this module's dtypes on new objects, so the shared ones are
+        left untouched.
+        
+        Args:
+            frames (dict): 'sample_data', 'demand_patterns' and
+                'inventory_data' DataFrames; sample_data needs a parsed
+                timestamp column
+                
+        Returns:
+            bool: True if all data loaded successfully, False otherwise
+        """
+        try:
+            self.sample_data = self._add_time_keys(frames['sample_data'].astype(_SAMPLE_DTYPES))
+            self.demand_patterns = frames['demand_patterns']
+            self.inventory_data = frames['inventory_data'].astype(_INVENTORY_DTYPES)
+            
+            print("✅ All data loaded successfully!")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error loading data: {str(e)}")
+            return False
+    
+    @staticmethod
+    def _add_time_keys(data):
+        """
+        Add int8 hour and day_of_week columns derived from the timestamp.
+        
+        Args:
+            data (pd.DataFrame): Sample data with a parsed timestamp column
+            
+        Returns:
+            pd.DataFrame: The same frame with hour and day_of_week set
+        """
+        # Hour and weekday from integer hour/day counts since the epoch (a Thursday)
+        timestamps = data['timestamp'].to_numpy()
+        data['hour'] = (timestamps.astype('datetime64[h]').astype(np.int64) % 24).astype(np.int8)
+        data['day_of_week'] = ((timestamps.astype('datetime64[D]').astype(np.int64) + 3) % 7).astype(np.int8)
+        return data
+    
     def create_demand_features(self, data):
         """
         Create features for demand forecasting.
@@ -79,28 +309,30 @@ class InventoryOptimizer:
             pd.DataFrame: Data with additional features
         """
         # Time-based features
-        data['hour_sin'] = np.sin(2 * np.pi * data['hour'] / 24)
-        data['hour_cos'] = np.cos(2 * np.pi * data['hour'] / 24)
-        data['day_sin'] = np.sin(2 * np.pi * data['day_of_week'] / 7)
-        data['day_cos'] = np.cos(2 * np.pi * data['day_of_week'] / 7)
-        
-        # Lag features
-        for category in data['category'].unique():
-            category_data = data[data['category'] == category].copy()
-            category_data = category_data.sort_values('timestamp')
-            
-            # Create lag features
-            category_data['demand_lag_1'] = category_data['demand_quantity'].shift(1)
-            category_data['demand_lag_2'] = category_data['demand_quantity'].shift(2)
-            category_data['demand_ma_3'] = category_data['demand_quantity'].rolling(window=3).mean()
-            
-            # Update main dataframe
-            data.loc[data['category'] == category, 'demand_lag_1'] = category_data['demand_lag_1']
-            data.loc[data['category'] == category, 'demand_lag_2'] = category_data['demand_lag_2']
-            data.loc[data['category'] == category, 'demand_ma_3'] = category_data['demand_ma_3']
-        
-        # Fill missing values
-        data = data.fillna(method='bfill').fillna(method='ffill')
+        hours = data['hour'].to_numpy()
+        days = data['day_of_week'].to_numpy()
+        data['hour_sin'] = _HOUR_SIN[hours]
+        data['hour_cos'] = _HOUR_COS[hours]
+        data['day_sin'] = _DAY_SIN[days]
+        data['day_cos'] = _DAY_COS[days]
+        
+        # Lag features, per category in timestamp order. They follow the
+        # category's rows, as the per-category models and forecast_demand do,
+        # so in a category with several products the lags run across products
+        ordered = data.sort_values('timestamp', kind='stable')
+        category_demand = ordered.groupby('category', observed=True, sort=False)['demand_quantity']
+        
+        lag_features = pd.DataFrame({
+            'demand_lag_1': category_demand.shift(1),
+            'demand_lag_2': category_demand.shift(2),
+            'demand_ma_3': category_demand.rolling(window=3).mean().reset_index(level=0, drop=True)
+        })
+        
+        # Fill the leading gaps of each category from its own later rows
+        lag_features = lag_features.groupby(ordered['category'], observed=True, sort=False).bfill()
+        
+        # Assignment aligns on the index, so rows keep their input order
+        data[list(lag_features.columns)] = lag_features
         
         return data
     
@@ -115,52 +347,67 @@ class InventoryOptimizer:
             print("❌ Please load data first using load_data()")
             return None
         
+        # Prepare features and target
+        feature_columns = ['hour_sin', 'hour_cos', 'day_sin', 'day_cos', 
+                         'demand_lag_1', 'demand_lag_2', 'demand_ma_3']
+        
+        # Reuse models trained on identical data, features and model version
+        cache_key = (_MODEL_VERSION, tuple(feature_columns), _data_fingerprint(self.sample_data))
+        if joblib is not None and os.path.exists(_MODEL_CACHE_PATH):
+            try:
+                key, forecast_models, models_performance = joblib.load(_MODEL_CACHE_PATH)
+                if key == cache_key:
+                    self.forecast_models = forecast_models
+                    print("✅ Loaded cached forecasting models!")
+                    return models_performance
+            except (OSError, ValueError, EOFError):
+                pass  # Retrain below
+        
         # Prepare data with features
-        data_with_features = self.create_demand_features(self.sample_data.copy())
+        data_with_features = self.create_demand_features(self.sample_data.copy(deep=False))
         
         models_performance = {}
         
-        # Train model for each category
+        # Sort once; each category's rows are then already in timestamp order
+        ordered = data_with_features.sort_values('timestamp', kind='stable')
+        category_rows = ordered.groupby('category', observed=True, sort=False).indices
+        
+        # Split each category's data (80% train, 20% test)
+        splits = {}
         for category in data_with_features['category'].unique():
             print(f"🤖 Training model for {category}...")
             
-            category_data = data_with_features[data_with_features['category'] == category].copy()
-            category_data = category_data.sort_values('timestamp')
-            
-            # Prepare features and target
-            feature_columns = ['hour_sin', 'hour_cos', 'day_sin', 'day_cos', 
-                             'demand_lag_1', 'demand_lag_2', 'demand_ma_3']
+            category_data = ordered.iloc[category_rows[category]]
             
             X = category_data[feature_columns].dropna()
             y = category_data.loc[X.index, 'demand_quantity']
             
-            # Split data (80% train, 20% test)
             split_idx = int(len(X) * 0.8)
-            X_train, X_test = X[:split_idx], X[split_idx:]
-            y_train, y_test = y[:split_idx], y[split_idx:]
-            
-            # Scale features
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
-            
-            # Train model
-            model = LinearRegression()
-            model.fit(X_train_scaled, y_train)
-            
+            splits[category] = (X[:split_idx], X[split_idx:], y[:split_idx], y[split_idx:])
+        
+        # Train all category models in one stacked solve
+        thetas = _fit_linear_batch(
+            [X_train.to_numpy() for X_train, _, _, _ in splits.values()],
+            [y_train.to_numpy() for _, _, y_train, _ in splits.values()]
+        )
+        
+        for theta, (category, (_, X_test, _, y_test)) in zip(thetas, splits.items()):
             # Make predictions
-            y_pred = model.predict(X_test_scaled)
+            y_pred = _predict_linear(theta, X_test.to_numpy())
+            y_true = y_test.to_numpy(dtype=np.float64)
             
-            # Calculate metrics
-            mae = mean_absolute_error(y_test, y_pred)
-            mse = mean_squared_error(y_test, y_pred)
+            # Calculate metrics; zero-demand hours add no percentage error
+            abs_error = np.abs(y_true - y_pred)
+            mae = float(abs_error.mean())
+            mse = float((abs_error * abs_error).mean())
             rmse = np.sqrt(mse)
-            mape = np.mean(np.abs((y_test - y_pred) / y_test)) * 100
+            np.divide(abs_error, y_true, out=abs_error, where=y_true != 0)
+            abs_error[y_true == 0] = 0.0
+            mape = float(abs_error.mean()) * 100
             
             # Store model and performance
             self.forecast_models[category] = {
-                'model': model,
-                'scaler': scaler,
+                'coefficients': theta,
                 'features': feature_columns,
                 'performance': {
                     'MAE': round(mae, 2),
@@ -175,6 +422,16 @@ class InventoryOptimizer:
                 'MAPE': round(mape, 2)
             }
         
+        if joblib is not None:
+            # Write beside the cache and swap it in, so a reader never sees a partial file
+            tmp_path = f'{_MODEL_CACHE_PATH}.tmp'
+            try:
+                os.makedirs(os.path.dirname(_MODEL_CACHE_PATH), exist_ok=True)
+                joblib.dump((cache_key, self.forecast_models, models_performance), tmp_path)
+                os.replace(tmp_path, _MODEL_CACHE_PATH)
+            except OSError:
+                pass  # Caching is best effort; the trained models are still usable
+        
         print("✅ All forecasting models trained successfully!")
         return models_performance
     
@@ -192,51 +449,51 @@ class InventoryOptimizer:
             print("❌ Please train models first using train_demand_forecasting_models()")
             return None
         
-        forecasts = []
+        categories = list(self.forecast_models.keys())
+        features = self.forecast_models[categories[0]]['features']
+        thetas = np.stack([self.forecast_models[c]['coefficients'] for c in categories])
+        n_categories = len(categories)
         
         # Create future timestamps
         last_timestamp = self.sample_data['timestamp'].max()
-        future_timestamps = [last_timestamp + timedelta(hours=i) for i in range(1, hours_ahead + 1)]
-        
-        for category in self.forecast_models.keys():
-            model_info = self.forecast_models[category]
-            model = model_info['model']
-            scaler = model_info['scaler']
-            features = model_info['features']
-            
-            # Get recent data for lag features
-            recent_data = self.sample_data[self.sample_data['category'] == category].tail(5)
-            
-            for timestamp in future_timestamps:
-                hour = timestamp.hour
-                day_of_week = timestamp.weekday()
-                
-                # Create features
-                feature_values = {
-                    'hour_sin': np.sin(2 * np.pi * hour / 24),
-                    'hour_cos': np.cos(2 * np.pi * hour / 24),
-                    'day_sin': np.sin(2 * np.pi * day_of_week / 7),
-                    'day_cos': np.cos(2 * np.pi * day_of_week / 7),
-                    'demand_lag_1': recent_data['demand_quantity'].iloc[-1] if len(recent_data) > 0 else 10,
-                    'demand_lag_2': recent_data['demand_quantity'].iloc[-2] if len(recent_data) > 1 else 10,
-                    'demand_ma_3': recent_data['demand_quantity'].tail(3).mean() if len(recent_data) >= 3 else 10
-                }
-                
-                # Prepare feature vector
-                X_future = np.array([[feature_values[f] for f in features]])
-                X_future_scaled = scaler.transform(X_future)
-                
-                # Make prediction
-                predicted_demand = max(0, model.predict(X_future_scaled)[0])
-                
-                forecasts.append({
-                    'timestamp': timestamp,
-                    'hour': hour,
-                    'category': category,
-                    'predicted_demand': round(predicted_demand, 1)
-                })
-        
-        forecast_df = pd.DataFrame(forecasts)
+        future_timestamps = last_timestamp + pd.to_timedelta(np.arange(1, hours_ahead + 1), unit='h')
+        hours = future_timestamps.hour.to_numpy()
+        days = future_timestamps.dayofweek.to_numpy()
+        
+        # Lag features from each category's latest rows; they are the same for every future hour
+        recent = self.sample_data.groupby('category', observed=True, sort=False).tail(3)
+        recent_demand = {
+            category: demand.to_numpy()
+            for category, demand in recent.groupby('category', observed=True, sort=False)['demand_quantity']
+        }
+        recent_demand = [recent_demand.get(c, np.array([])) for c in categories]
+        lag_1 = np.array([d[-1] if len(d) > 0 else 10 for d in recent_demand], dtype=float)
+        lag_2 = np.array([d[-2] if len(d) > 1 else 10 for d in recent_demand], dtype=float)
+        ma_3 = np.array([d.mean() if len(d) >= 3 else 10 for d in recent_demand], dtype=float)
+        
+        # Feature grids of shape (categories, hours)
+        grid = (n_categories, hours_ahead)
+        feature_values = {
+            'hour_sin': np.broadcast_to(_HOUR_SIN[hours], grid),
+            'hour_cos': np.broadcast_to(_HOUR_COS[hours], grid),
+            'day_sin': np.broadcast_to(_DAY_SIN[days], grid),
+            'day_cos': np.broadcast_to(_DAY_COS[days], grid),
+            'demand_lag_1': np.broadcast_to(lag_1[:, None], grid),
+            'demand_lag_2': np.broadcast_to(lag_2[:, None], grid),
+            'demand_ma_3': np.broadcast_to(ma_3[:, None], grid)
+        }
+        X_future = np.stack([feature_values[f] for f in features], axis=-1)
+        
+        # Predict every category and hour in one contraction
+        predicted = thetas[:, :1] + np.einsum('khp,kp->kh', X_future, thetas[:, 1:])
+        predicted = np.round(np.maximum(predicted, 0), 1)
+        
+        forecast_df = pd.DataFrame({
+            'timestamp': np.tile(future_timestamps.to_numpy(), n_categories),
+            'hour': np.tile(hours, n_categories).astype(np.int8),
+            'category': np.repeat(categories, hours_ahead),
+            'predicted_demand': predicted.ravel()
+        })
         return forecast_df
     
     def calculate_optimal_stock_levels(self, service_level=0.95):
@@ -254,9 +511,9 @@ class InventoryOptimizer:
             return None
         
         # Calculate demand statistics by category
-        demand_stats = self.sample_data.groupby('category')['demand_quantity'].agg([
+        demand_stats = self.sample_data.groupby('category', observed=True)['demand_quantity'].agg([
             'mean', 'std', 'max'
-        ]).reset_index()
+        ])
         
         # Z-score for service level
         z_score = {
@@ -265,50 +522,32 @@ class InventoryOptimizer:
             0.99: 2.33
         }.get(service_level, 1.65)
         
-        optimal_levels = []
-        
-        for _, row in self.inventory_data.iterrows():
-            category = row['category']
-            dark_store = row['dark_store_id']
-            
-            # Get demand statistics for this category
-            cat_stats = demand_stats[demand_stats['category'] == category].iloc[0]
-            
-            # Calculate optimal stock levels
-            avg_demand = cat_stats['mean']
-            demand_std = cat_stats['std'] if cat_stats['std'] > 0 else avg_demand * 0.2
-            lead_time = row['lead_time_hours']
-            
-            # Calculate components
-            avg_demand_during_lead_time = avg_demand * (lead_time / 24)  # Convert to daily
-            safety_stock = z_score * demand_std * np.sqrt(lead_time / 24)
-            
-            # Optimal order quantity (Economic Order Quantity approximation)
-            holding_cost = row['storage_cost_per_unit'] * 0.2  # 20% holding cost
-            order_cost = 50  # Assumed fixed ordering cost
-            annual_demand = avg_demand * 365
-            
-            eoq = np.sqrt((2 * annual_demand * order_cost) / holding_cost) if holding_cost > 0 else avg_demand * 7
-            
-            # Calculate final recommendations
-            reorder_point = avg_demand_during_lead_time + safety_stock
-            max_stock = reorder_point + eoq
-            
-            optimal_levels.append({
-                'dark_store_id': dark_store,
-                'product_name': row['product_name'],
-                'category': category,
-                'current_stock': row['current_stock'],
-                'avg_daily_demand': round(avg_demand, 1),
-                'safety_stock': round(safety_stock, 1),
-                'reorder_point': round(reorder_point, 1),
-                'optimal_max_stock': round(max_stock, 1),
-                'eoq': round(eoq, 1),
-                'lead_time_hours': lead_time,
-                'service_level': service_level
-            })
-        
-        return pd.DataFrame(optimal_levels)
+        # Attach each item's category demand statistics
+        items = self.inventory_data.join(demand_stats, on='category')
+        avg_demand = items['mean'].to_numpy(dtype=np.float64)
+        
+        safety_stock, eoq, reorder_point, max_stock = _stock_level_kernel(
+            avg_demand,
+            items['std'].to_numpy(dtype=np.float64),
+            items['lead_time_hours'].to_numpy(dtype=np.float64),
+            items['storage_cost_per_unit'].to_numpy(dtype=np.float64),
+            z_score,
+            50.0  # Assumed fixed ordering cost
+        )
+        
+        return pd.DataFrame({
+            'dark_store_id': items['dark_store_id'],
+            'product_name': items['product_name'],
+            'category': items['category'],
+            'current_stock': items['current_stock'],
+            'avg_daily_demand': np.round(avg_demand, 1),
+            'safety_stock': np.round(safety_stock, 1),
+            'reorder_point': np.round(reorder_point, 1),
+            'optimal_max_stock': np.round(max_stock, 1),
+            'eoq': np.round(eoq, 1),
+            'lead_time_hours': items['lead_time_hours'],
+            'service_level': service_level
+        })
     
     def generate_restocking_schedule(self, forecast_horizon=72):
         """
@@ -330,75 +569,64 @@ class InventoryOptimizer:
         if optimal_levels is None:
             return None
         
-        restocking_schedule = []
-        
-        # Aggregate forecast by category for next 24 hours
-        next_24h_demand = forecasts[forecasts['timestamp'] <= forecasts['timestamp'].min() + timedelta(hours=24)]
-        demand_summary = next_24h_demand.groupby('category')['predicted_demand'].sum().reset_index()
-        
-        for _, inventory_row in self.inventory_data.iterrows():
-            category = inventory_row['category']
-            dark_store = inventory_row['dark_store_id']
-            current_stock = inventory_row['current_stock']
-            
-            # Get optimal levels for this item
-            optimal_row = optimal_levels[
-                (optimal_levels['category'] == category) & 
-                (optimal_levels['dark_store_id'] == dark_store)
-            ]
-            
-            if len(optimal_row) == 0:
-                continue
-                
-            optimal_data = optimal_row.iloc[0]
-            reorder_point = optimal_data['reorder_point']
-            max_stock = optimal_data['optimal_max_stock']
-            
-            # Get predicted demand for this category
-            predicted_demand_24h = demand_summary[
-                demand_summary['category'] == category
-            ]['predicted_demand'].iloc[0] if len(demand_summary[demand_summary['category'] == category]) > 0 else 0
-            
-            # Calculate stock projection
-            projected_stock_24h = current_stock - predicted_demand_24h
-            
-            # Determine if restocking is needed
-            needs_restock = projected_stock_24h <= reorder_point
-            urgency = 'Low'
-            
-            if projected_stock_24h <= 0:
-                urgency = 'Critical'
-            elif projected_stock_24h <= reorder_point * 0.5:
-                urgency = 'High'
-            elif projected_stock_24h <= reorder_point:
-                urgency = 'Medium'
-            
-            # Calculate suggested order quantity
-            if needs_restock:
-                suggested_order = max_stock - current_stock
-            else:
-                suggested_order = 0
-            
-            restocking_schedule.append({
-                'dark_store_id': dark_store,
-                'product_name': inventory_row['product_name'],
-                'category': category,
-                'current_stock': current_stock,
-                'predicted_demand_24h': round(predicted_demand_24h, 1),
-                'projected_stock_24h': round(projected_stock_24h, 1),
-                'reorder_point': round(reorder_point, 1),
-                'needs_restock': needs_restock,
-                'urgency': urgency,
-                'suggested_order_qty': round(suggested_order, 1),
-                'lead_time_hours': inventory_row['lead_time_hours'],
-                'supplier_reliability': inventory_row['supplier_reliability']
-            })
-        
-        schedule_df = pd.DataFrame(restocking_schedule)
+        # Aggregate forecast by category for next 24 hours; forecasts are category-major
+        # with one row per hour, and the window includes both its end hours
+        predicted_demand = forecasts['predicted_demand'].to_numpy().reshape(-1, forecast_horizon)
+        demand_summary = pd.Series(
+            predicted_demand[:, :25].sum(axis=1),
+            index=pd.Index(forecasts['category'].to_numpy()[::forecast_horizon], name='category')
+        )
+        
+        # Each item takes the first optimal levels row of its store and category;
+        # items without one are dropped
+        store_levels = optimal_levels.drop_duplicates(['dark_store_id', 'category']).set_index(
+            ['dark_store_id', 'category']
+        )[['reorder_point', 'optimal_max_stock']]
+        
+        items = self.inventory_data[
+            ['dark_store_id', 'product_name', 'category', 'current_stock',
+             'lead_time_hours', 'supplier_reliability']
+        ].join(
+            store_levels, on=['dark_store_id', 'category'], how='inner'
+        ).join(
+            demand_summary.rename('predicted_demand_24h'), on='category'
+        ).fillna({'predicted_demand_24h': 0}).reset_index(drop=True)
+        
+        current_stock = items['current_stock'].to_numpy()
+        reorder_point = items['reorder_point'].to_numpy()
+        predicted_demand_24h = items['predicted_demand_24h'].to_numpy()
+        
+        # Calculate stock projection
+        projected_stock_24h = current_stock - predicted_demand_24h
+        
+        # Determine if restocking is needed
+        needs_restock = projected_stock_24h <= reorder_point
+        urgency_score = np.select(
+            [projected_stock_24h <= 0, projected_stock_24h <= reorder_point * 0.5, needs_restock],
+            [4, 3, 2],
+            default=1
+        ).astype(np.int8)
+        
+        # Calculate suggested order quantity
+        suggested_order = np.where(needs_restock, items['optimal_max_stock'].to_numpy() - current_stock, 0)
+        
+        schedule_df = pd.DataFrame({
+            'dark_store_id': items['dark_store_id'],
+            'product_name': items['product_name'],
+            'category': items['category'],
+            'current_stock': items['current_stock'],
+            'predicted_demand_24h': np.round(predicted_demand_24h, 1),
+            'projected_stock_24h': np.round(projected_stock_24h, 1),
+            'reorder_point': np.round(reorder_point, 1),
+            'needs_restock': needs_restock,
+            'urgency': pd.Categorical.from_codes(urgency_score - 1, dtype=_URGENCY_DTYPE),
+            'suggested_order_qty': np.round(suggested_order, 1),
+            'lead_time_hours': items['lead_time_hours'],
+            'supplier_reliability': items['supplier_reliability'],
+            'urgency_score': urgency_score
+        })
         
         # Sort by urgency and projected stock
-        urgency_order = {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}
-        schedule_df['urgency_score'] = schedule_df['urgency'].map(urgency_order)
         schedule_df = schedule_df.sort_values(['urgency_score', 'projected_stock_24h'], ascending=[False, True])
         
         return schedule_df
@@ -414,26 +642,19 @@ class InventoryOptimizer:
             print("❌ Please load data first using load_data()")
             return None
         
-        # Calculate current costs
-        self.inventory_data['holding_cost'] = (
-            self.inventory_data['current_stock'] * 
-            self.inventory_data['storage_cost_per_unit'] * 
-            0.2  # Annual holding cost rate
-        ) / 365  # Daily holding cost
-        
-        # Calculate stockout costs (estimated)
-        demand_stats = self.sample_data.groupby('category')['demand_quantity'].mean().reset_index()
-        demand_dict = dict(zip(demand_stats['category'], demand_stats['demand_quantity']))
-        
-        stockout_costs = []
-        for _, row in self.inventory_data.iterrows():
-            avg_demand = demand_dict.get(row['category'], 10)
-            stockout_probability = max(0, (avg_demand - row['current_stock']) / avg_demand) if avg_demand > 0 else 0
-            stockout_cost = stockout_probability * avg_demand * 5  # $5 per lost sale
-            stockout_costs.append(stockout_cost)
-        
-        self.inventory_data['stockout_cost'] = stockout_costs
-        self.inventory_data['total_cost'] = self.inventory_data['holding_cost'] + self.inventory_data['stockout_cost']
+        # Average demand per item's category drives the stockout estimate
+        category_demand = self.sample_data.groupby('category', observed=True)['demand_quantity'].mean()
+        avg_demand = self.inventory_data['category'].map(category_demand).fillna(10).to_numpy(dtype=np.float64)
+        
+        holding_cost, stockout_cost, total_cost = _inventory_cost_kernel(
+            self.inventory_data['current_stock'].to_numpy(dtype=np.float64),
+            self.inventory_data['storage_cost_per_unit'].to_numpy(dtype=np.float64),
+            avg_demand,
+            5.0  # $5 per lost sale
+        )
+        self.inventory_data['holding_cost'] = holding_cost
+        self.inventory_data['stockout_cost'] = stockout_cost
+        self.inventory_data['total_cost'] = total_cost
         
         # Aggregate costs
         cost_analysis = {
@@ -12,19 +12,441 @@ Date: 2024
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import plotly.offline as pyo
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import copy
+import hashlib
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+try:
+    from numba import njit, prange, config as numba_config
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba is optional; without it the partial sums come from a pandas groupby
+    _HAS_NUMBA = False
+    prange = range
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import xxhash
+except ImportError:
+    # xxhash is optional; chart fingerprints fall back to hashlib's blake2b
+    xxhash = None
+
+try:
+    import orjson  # noqa: F401
+    # orjson serializes NumPy arrays natively and much faster than the
+    # default encoder, which every to_json and write_html goes through
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass  # Plotly's default JSON encoder is used without it
+
+# Flipkart brand palette shared by every chart and suite instance; treat it
+# as read-only (a plain dict so suites still pickle into worker processes)
+FLIPKART_COLORS = {
+    'primary': '#FF6B35',      # Flipkart Orange
+    'secondary': '#047BD2',     # Flipkart Blue
+    'success': '#28A745',
+    'warning': '#FFC107',
+    'danger': '#DC3545',
+    'info': '#17A2B8'
+}
+
+# Store delivery-time bars are green up to 15 min, amber up to 20 and red
+# beyond; np.digitize(..., right=True) maps times to these colors
+_DELIVERY_COLOR_BINS = np.array([15, 20])
+_DELIVERY_COLORS = np.array([FLIPKART_COLORS['success'], FLIPKART_COLORS['warning'], FLIPKART_COLORS['danger']])
+
+# Scatter traces above this many points use the WebGL renderer; SVG is cheaper
+# to set up for the few dozen points the aggregated charts usually plot
+_WEBGL_MIN_POINTS = 500
+
+# Column types for sample_data.csv: categorical keys group on integer codes,
+# and 32-bit measures halve the memory the aggregations scan
+_SAMPLE_DTYPES = {
+    'category': 'category',
+    'dark_store_id': 'category',
+    'demand_quantity': 'int32',
+    'stock_available': 'int32',
+    'orders_fulfilled': 'int32',
+    'orders_cancelled': 'int32',
+    'delivery_time_minutes': 'float32',
+    'csat_score': 'float32'
+}
+
+# HTML exports load plotly.js from the CDN instead of inlining the ~3MB bundle
+# in every file. Figures are built here from validated traces, so the export
+# skips re-validating them
+_WRITE_HTML_KWARGS = dict(include_plotlyjs='cdn', full_html=True, validate=False)
+
+# Saved charts start with this comment line naming the fingerprint of the data
+# and chart code they were built from, so unchanged charts can be skipped
+_HTML_PATH = 'visualizations/{}.html'
+_HTML_HEADER = '<!-- flipkart-minutes data fingerprint: {} -->\n'
+
+# Hours compared on the KPI dashboard: the peak-hour bar covers the busiest
+# hours, the off-peak bar everything outside the morning and evening rushes
+_PEAK_HOURS = np.array([8, 18, 19], dtype=np.int8)
+_RUSH_HOURS = np.array([7, 8, 9, 17, 18, 19, 20], dtype=np.int8)
+
+# Charts built by generate_all_visualizations: result key, builder method and
+# progress label, in output order
+_CHARTS = (
+    ('demand_heatmap', 'create_demand_heatmap', 'Creating demand heatmap...'),
+    ('delivery_trends', 'create_delivery_time_trends', 'Creating delivery trends dashboard...'),
+    ('store_performance', 'create_performance_comparison', 'Creating store performance comparison...'),
+    ('category_analysis', 'create_category_analysis', 'Creating category analysis...'),
+    ('kpi_dashboard', 'create_kpi_dashboard', 'Creating KPI dashboard...')
+)
+
+def _source_fingerprint(data_path):
+    """
+    Fast content hash of sample_data.csv and this module's source.
+    
+    Hashing the chart code as well means saved charts are rebuilt when
+    either the data or the way it is charted changes.
+    
+    Args:
+        data_path (str): Path to the data directory
+        
+    Returns:
+        str: Hex digest
+    """
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+    for path in (f'{data_path}sample_data.csv', os.path.abspath(__file__)):
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(block)
+    return hasher.hexdigest()
+
+def _html_is_current(name, fingerprint):
+    """
+    Whether the saved HTML for a chart was built from the given fingerprint.
+    
+    Args:
+        name (str): Chart file name without extension
+        fingerprint (str): Fingerprint from _source_fingerprint
+        
+    Returns:
+        bool: True if the file exists and its header names the fingerprint
+    """
+    try:
+        with open(_HTML_PATH.format(name), encoding='utf-8') as f:
+            return f.readline() == _HTML_HEADER.format(fingerprint)
+    except OSError:
+        return False
+
+def _render_chart(suite, method_name):
+    """Build and save one chart; module level so process pool workers can run it."""
+    return getattr(suite, method_name)()
+
+def _read_csv(path, **kwargs):
+    """
+    Read a CSV with the multithreaded pyarrow parser when it is installed.
+    
+    Args:
+        path (str): Path to the CSV file
+        **kwargs: Further pd.read_csv arguments
+        
+    Returns:
+        pd.DataFrame: Parsed data
+    """
+    try:
+        return pd.read_csv(path, engine='pyarrow', **kwargs)
+    except ImportError:
+        return pd.read_csv(path, **kwargs)
+
+# Partial sums are kept per category, store and hour; every chart aggregate
+# rolls up from them
+_PARTIAL_KEYS = ['category', 'dark_store_id', 'hour']
+
+# Rows each parallel block of the bucket kernel covers at minimum; smaller
+# inputs run as one serial block, so Numba's thread pool is never started
+# for them
+_ROWS_PER_BLOCK = 100_000
+
+@njit(cache=True)
+def _bucket_block_sums(cell, start, stop, demand, fulfilled, cancelled, delivery, csat, counts, totals):
+    """
+    Add rows start:stop into the per-cell counts and totals.
+    
+    Rows with a missing key (cell -1) are skipped, and missing measures are
+    left out of their sums and counts.
+    
+    Args:
+        counts (np.ndarray): int64 [n_cells, 7] rows, demand, fulfilled,
+            cancelled, delivery_n, on_time, csat_n
+        totals (np.ndarray): float64 [n_cells, 3] delivery_sum,
+            delivery_sq, csat_sum
+    """
+    for i in range(start, stop):
+        c = cell[i]
+        if c < 0:
+            continue
+        counts[c, 0] += 1
+        counts[c, 1] += demand[i]
+        counts[c, 2] += fulfilled[i]
+        counts[c, 3] += cancelled[i]
+        d = np.float64(delivery[i])
+        if not np.isnan(d):
+            totals[c, 0] += d
+            totals[c, 1] += d * d
+            counts[c, 4] += 1
+            if d <= 15:
+                counts[c, 5] += 1
+        s = np.float64(csat[i])
+        if not np.isnan(s):
+            totals[c, 2] += s
+            counts[c, 6] += 1
+
+@njit(parallel=True, cache=True)
+def _bucket_sums_kernel(cell, n_cells, n_blocks, demand, fulfilled, cancelled, delivery, csat):
+    """
+    Accumulate the partial sums per cell over the rows in parallel blocks.
+    
+    Each block adds into its own slice of the partial arrays, which are
+    summed at the end, so no two threads write the same cell.
+    
+    Returns:
+        tuple: (counts, totals) laid out as in _bucket_block_sums
+    """
+    n_rows = cell.shape[0]
+    block = (n_rows + n_blocks - 1) // n_blocks
+    counts = np.zeros((n_blocks, n_cells, 7), dtype=np.int64)
+    totals = np.zeros((n_blocks, n_cells, 3), dtype=np.float64)
+    
+    for b in prange(n_blocks):
+        _bucket_block_sums(cell, b * block, min(n_rows, (b + 1) * block),
+                           demand, fulfilled, cancelled, delivery, csat, counts[b], totals[b])
+    
+    return counts.sum(axis=0), totals.sum(axis=0)
+
+def _partial_sums(chunk):
+    """
+    Additive sums of a chunk of sample data per category, store and hour.
+    
+    Means and standard deviations are recovered from the sums, squared sums
+    and non-null counts, so the sums of several chunks combine by addition.
+    Uses the Numba bucket kernel when numba is installed and a pandas
+    groupby otherwise.
+    
+    Args:
+        chunk (pd.DataFrame): Sample rows with the hour column set
+        
+    Returns:
+        pd.DataFrame: Sums indexed by (category, dark_store_id, hour)
+    """
+    if _HAS_NUMBA:
+        return _partial_sums_with_kernel(chunk)
+    
+    delivery = chunk['delivery_time_minutes'].to_numpy(dtype=np.float64)
+    csat = chunk['csat_score'].to_numpy(dtype=np.float64)
+    delivery_valid = ~np.isnan(delivery)
+    csat_valid = ~np.isnan(csat)
+    
+    parts = pd.DataFrame({
+        'category': chunk['category'],
+        'dark_store_id': chunk['dark_store_id'],
+        'hour': chunk['hour'],
+        'rows': np.ones(len(chunk), dtype=np.int64),
+        'demand': chunk['demand_quantity'].to_numpy(dtype=np.int64),
+        'fulfilled': chunk['orders_fulfilled'].to_numpy(dtype=np.int64),
+        'cancelled': chunk['orders_cancelled'].to_numpy(dtype=np.int64),
+        'delivery_sum': np.where(delivery_valid, delivery, 0.0),
+        'delivery_sq': np.where(delivery_valid, delivery * delivery, 0.0),
+        'delivery_n': delivery_valid.astype(np.int64),
+        'on_time': (delivery <= 15).astype(np.int64),
+        'csat_sum': np.where(csat_valid, csat, 0.0),
+        'csat_n': csat_valid.astype(np.int64)
+    })
+    return parts.groupby(_PARTIAL_KEYS, observed=True).sum()
+
+def _partial_sums_with_kernel(chunk):
+    """
+    _partial_sums computed by the Numba bucket kernel.
+    
+    Cells are laid out category-major, so cell = (category code * stores +
+    store code) * 24 + hour, which keeps the result in groupby order.
+    
+    Args:
+        chunk (pd.DataFrame): Sample rows with the hour column set
+        
+    Returns:
+        pd.DataFrame: Sums indexed by (category, dark_store_id, hour)
+    """
+    category, store = chunk['category'], chunk['dark_store_id']
+    category_codes = category.cat.codes.to_numpy()
+    store_codes = store.cat.codes.to_numpy()
+    n_stores = len(store.cat.categories)
+    n_cells = len(category.cat.categories) * n_stores * 24
+    
+    cell = (category_codes.astype(np.int64) * n_stores + store_codes) * 24 + chunk['hour'].to_numpy()
+    cell[(category_codes < 0) | (store_codes < 0)] = -1
+    
+    measures = (
+        chunk['demand_quantity'].to_numpy(), chunk['orders_fulfilled'].to_numpy(),
+        chunk['orders_cancelled'].to_numpy(), chunk['delivery_time_minutes'].to_numpy(),
+        chunk['csat_score'].to_numpy()
+    )
+    # Read the thread count from the config: get_num_threads() would start
+    # the thread pool even when the input fits in one block
+    n_blocks = max(1, min(numba_config.NUMBA_NUM_THREADS, len(chunk) // _ROWS_PER_BLOCK))
+    if n_blocks == 1:
+        counts = np.zeros((n_cells, 7), dtype=np.int64)
+        totals = np.zeros((n_cells, 3), dtype=np.float64)
+        _bucket_block_sums(cell, 0, len(cell), *measures, counts, totals)
+    else:
+        counts, totals = _bucket_sums_kernel(cell, n_cells, n_blocks, *measures)
+    
+    # Keep only observed cells, as groupby(observed=True) does
+    cells = np.flatnonzero(counts[:, 0])
+    counts, totals = counts[cells], totals[cells]
+    category_idx, rest = np.divmod(cells, n_stores * 24)
+    store_idx, hour = np.divmod(rest, 24)
+    index = pd.MultiIndex.from_arrays([
+        pd.Categorical.from_codes(category_idx, dtype=category.dtype),
+        pd.Categorical.from_codes(store_idx, dtype=store.dtype),
+        hour.astype(np.int8)
+    ], names=_PARTIAL_KEYS)
+    
+    return pd.DataFrame({
+        'rows': counts[:, 0],
+        'demand': counts[:, 1],
+        'fulfilled': counts[:, 2],
+        'cancelled': counts[:, 3],
+        'delivery_sum': totals[:, 0],
+        'delivery_sq': totals[:, 1],
+        'delivery_n': counts[:, 4],
+        'on_time': counts[:, 5],
+        'csat_sum': totals[:, 2],
+        'csat_n': counts[:, 6]
+    }, index=index)
+
+def _mean(sums, name):
+    """float32 mean of a measure from its rolled-up sum and non-null count."""
+    return (sums[f'{name}_sum'] / sums[f'{name}_n']).astype(np.float32)
+
+def _scatter_trace(n_points):
+    """Scatter trace class for n_points: Scattergl for large traces, Scatter otherwise."""
+    return go.Scattergl if n_points > _WEBGL_MIN_POINTS else go.Scatter
+
+def _target_lines(targets):
+    """
+    Shapes and label annotations for dashed red target lines on subplots.
+    
+    Builds the same line shape and label annotation as add_hline, without
+    add_hline's per-call subplot lookup.
+    
+    Args:
+        targets (list): (axis number, y value, label) per line; axis 1 is
+            the first subplot's x/y pair, 2 is x2/y2, and so on
+            
+    Returns:
+        tuple: (shapes, annotations) tuples of layout dicts
+    """
+    shapes, annotations = [], []
+    for axis, y, label in targets:
+        suffix = '' if axis == 1 else str(axis)
+        xref, yref = f'x{suffix} domain', f'y{suffix}'
+        shapes.append(dict(type='line', xref=xref, x0=0, x1=1, yref=yref, y0=y, y1=y,
+                           line=dict(color='red', dash='dash')))
+        annotations.append(dict(text=label, showarrow=False, xref=xref, x=1, xanchor='right',
+                                yref=yref, y=y, yanchor='bottom'))
+    return tuple(shapes), tuple(annotations)
+
+def _add_target_lines(fig, lines):
+    """
+    Add _target_lines output to a figure in one assignment per layout list.
+    
+    Assigning directly skips update_layout, which re-validates the existing
+    annotations.
+    
+    Args:
+        fig (go.Figure): Subplot figure
+        lines (tuple): (shapes, annotations) from _target_lines
+    """
+    shapes, annotations = lines
+    fig.layout.shapes = fig.layout.shapes + shapes
+    fig.layout.annotations = fig.layout.annotations + annotations
+
+# Target lines are static, so their layout dicts are built once at import;
+# Plotly copies them into each figure
+_DELIVERY_TARGET_LINES = _target_lines([(1, 12, 'Target: 12 min')])
+_STORE_TARGET_LINES = _target_lines([
+    (1, 90, 'Target: 90%'),
+    (2, 15, 'Target: 15 min'),
+    (3, 4.0, 'Target: 4.0')
+])
+
+def _lttb_indices(x, y, max_points):
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps from a series.
+    
+    The first and last points are always kept. The points in between are
+    split into max_points - 2 buckets, and each bucket keeps the point
+    forming the largest triangle with the previously kept point and the
+    mean of the next bucket. Peaks and dips survive the reduction.
+    
+    Args:
+        x (array-like): Sorted numeric x values
+        y (array-like): y values
+        max_points (int): Number of points to keep (at least 3)
+        
+    Returns:
+        np.ndarray: Sorted indices of the kept points
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    keep = np.empty(max_points, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    
+    return keep
+
+def _downsample(x, y, max_points):
+    """
+    Reduce a line series to at most max_points points with LTTB.
+    
+    Series already within the limit are returned unchanged.
+    
+    Args:
+        x (pd.Series): Sorted x values
+        y (pd.Series): y values
+        max_points (int): Maximum number of points to plot
+        
+    Returns:
+        tuple: (x, y) to pass to the trace
+    """
+    if max_points is None or len(x) <= max_points:
+        return x, y
+    keep = _lttb_indices(x, y, max(max_points, 3))
+    return x.to_numpy()[keep], y.to_numpy()[keep]
 
 class FlipkartVisualizationSuite:
     """
@@ -38,33 +460,53 @@ class FlipkartVisualizationSuite:
     - Business metric visualizations
     """
     
-    def __init__(self, data_path='data/'):
+    def __init__(self, data_path='data/', chunksize=None):
         """
         Initialize the visualization suite.
         
         Args:
             data_path (str): Path to the data directory
+            chunksize (int): Rows per chunk to stream sample_data.csv in,
+                keeping only partial aggregates in memory (sample_data then
+                stays None). None reads the file whole
         """
         self.data_path = data_path
+        self.chunksize = chunksize
         self.sample_data = None
         self.demand_patterns = None
-        self.colors = {
-            'primary': '#FF6B35',      # Flipkart Orange
-            'secondary': '#047BD2',     # Flipkart Blue
-            'success': '#28A745',
-            'warning': '#FFC107',
-            'danger': '#DC3545',
-            'info': '#17A2B8'
-        }
+        
+        # Per-group aggregates shared by the chart methods, built in load_data
+        self._hourly_cat_demand = None
+        self._hourly_stats = None
+        self._store_stats = None
+        self._category_stats = None
+        self._totals = None
+        self._fingerprint = None
+        self.colors = FLIPKART_COLORS
         
     def load_data(self):
         """Load all required datasets for visualization."""
         try:
-            self.sample_data = pd.read_csv(f'{self.data_path}sample_data.csv')
-            self.sample_data['timestamp'] = pd.to_datetime(self.sample_data['timestamp'])
-            self.sample_data['hour'] = self.sample_data['timestamp'].dt.hour
+            sample_path = f'{self.data_path}sample_data.csv'
             
-            self.demand_patterns = pd.read_csv(f'{self.data_path}demand_patterns.csv')
+            if self.chunksize:
+                # Stream the rows and keep only their partial sums; the pyarrow
+                # reader cannot stream, so chunks come from the C parser
+                self.sample_data = None
+                partials = []
+                for chunk in pd.read_csv(sample_path, dtype=_SAMPLE_DTYPES, parse_dates=['timestamp'],
+                                         chunksize=self.chunksize):
+                    chunk['hour'] = chunk['timestamp'].dt.hour.astype(np.int8)
+                    partials.append(_partial_sums(chunk))
+            else:
+                # Typed parse: timestamps and categorical keys come out of the reader
+                self.sample_data = _read_csv(sample_path, dtype=_SAMPLE_DTYPES, parse_dates=['timestamp'])
+                self.sample_data['hour'] = self.sample_data['timestamp'].dt.hour.astype(np.int8)
+                partials = [_partial_sums(self.sample_data)]
+            
+            self.demand_patterns = _read_csv(f'{self.data_path}demand_patterns.csv')
+            self._build_aggregates(partials)
+            self._fingerprint = _source_fingerprint(self.data_path)
             
             print("✅ Visualization data loaded successfully!")
             return True
@@ -72,6 +514,86 @@ class FlipkartVisualizationSuite:
             print(f"❌ Error loading data: {str(e)}")
             return False
     
+    def _build_aggregates(self, partials):
+        """
+        Build the aggregates shared by all chart methods.
+        
+        The charts only plot small per-hour, per-store and per-category
+        frames. All of them are rolled up from the partial sums per category,
+        store and hour, so the rows are scanned once per load rather than
+        once per chart.
+        
+        Args:
+            partials (list): _partial_sums frames, one per chunk read
+        """
+        if len(partials) == 1:
+            sums = partials[0]
+        else:
+            sums = pd.concat(partials).groupby(level=_PARTIAL_KEYS, observed=True).sum()
+        
+        def rollup(level):
+            return sums.groupby(level=level, observed=True).sum()
+        
+        # Unstacking the sorted (category, hour) index reshapes in place of a
+        # long-frame pivot; float32 halves the z payload sent to Plotly
+        self._hourly_cat_demand = rollup(['category', 'hour'])['demand'].unstack('hour').astype(np.float32)
+        
+        hourly = rollup('hour')
+        avg_delivery = hourly['delivery_sum'] / hourly['delivery_n']
+        delivery_var = ((hourly['delivery_sq'] - hourly['delivery_sum'] * avg_delivery) /
+                        (hourly['delivery_n'] - 1)).where(hourly['delivery_n'] > 1).clip(lower=0)
+        self._hourly_stats = pd.DataFrame({
+            'avg_delivery_time': avg_delivery.astype(np.float32),
+            'delivery_std': np.sqrt(delivery_var).astype(np.float32),
+            'fulfilled': hourly['fulfilled'],
+            'cancelled': hourly['cancelled'],
+            'avg_csat': _mean(hourly, 'csat')
+        })
+        
+        stores = rollup('dark_store_id')
+        self._store_stats = pd.DataFrame({
+            'orders_fulfilled': stores['fulfilled'],
+            'orders_cancelled': stores['cancelled'],
+            'delivery_time_minutes': _mean(stores, 'delivery'),
+            'csat_score': _mean(stores, 'csat')
+        })
+        
+        categories = rollup('category')
+        self._category_stats = pd.DataFrame({
+            'demand_quantity': categories['demand'],
+            'orders_fulfilled': categories['fulfilled'],
+            'orders_cancelled': categories['cancelled'],
+            'delivery_time_minutes': _mean(categories, 'delivery'),
+            'csat_score': _mean(categories, 'csat')
+        })
+        
+        # Headline totals for the KPI cards, from the same sums
+        overall = hourly.sum()
+        peak = hourly[hourly.index.isin(_PEAK_HOURS)].sum()
+        off_peak = hourly[~hourly.index.isin(_RUSH_HOURS)].sum()
+        self._totals = {
+            'total_orders': int(overall['rows']),
+            'total_fulfilled': overall['fulfilled'],
+            'total_cancelled': overall['cancelled'],
+            'avg_delivery_time': overall['delivery_sum'] / overall['delivery_n'],
+            'avg_csat': overall['csat_sum'] / overall['csat_n'],
+            'on_time_rate': overall['on_time'] / overall['rows'] * 100,
+            'peak_delivery_time': peak['delivery_sum'] / peak['delivery_n'],
+            'off_peak_delivery_time': off_peak['delivery_sum'] / off_peak['delivery_n']
+        }
+    
+    def _save_html(self, fig, name):
+        """
+        Save a chart as visualizations/<name>.html, headed by the fingerprint.
+        
+        Args:
+            fig (plotly.graph_objects.Figure): Chart to save
+            name (str): File name without extension
+        """
+        html = fig.to_html(**_WRITE_HTML_KWARGS)
+        with open(_HTML_PATH.format(name), 'w', encoding='utf-8') as f:
+            f.write(_HTML_HEADER.format(self._fingerprint) + html)
+    
     def create_demand_heatmap(self, save_html=True):
         """
         Create an interactive heatmap showing demand patterns by hour and category.
@@ -82,16 +604,15 @@ class FlipkartVisualizationSuite:
         Returns:
             plotly.graph_objects.Figure: Interactive heatmap
         """
-        if self.sample_data is None:
+        if self._totals is None:
             self.load_data()
         
         # Prepare data for heatmap
-        heatmap_data = self.sample_data.groupby(['hour', 'category'])['demand_quantity'].sum().reset_index()
-        heatmap_pivot = heatmap_data.pivot(index='category', columns='hour', values='demand_quantity')
+        heatmap_pivot = self._hourly_cat_demand
         
         # Create interactive heatmap
         fig = go.Figure(data=go.Heatmap(
-            z=heatmap_pivot.values,
+            z=heatmap_pivot.to_numpy(),
             x=heatmap_pivot.columns,
             y=heatmap_pivot.index,
             colorscale='RdYlBu_r',
@@ -114,36 +635,39 @@ class FlipkartVisualizationSuite:
         )
         
         if save_html:
-            fig.write_html('visualizations/demand_heatmap.html')
+            self._save_html(fig, 'demand_heatmap')
             print("✅ Demand heatmap saved as HTML")
         
         return fig
     
-    def create_delivery_time_trends(self, save_html=True):
+    def create_delivery_time_trends(self, save_html=True, max_points=2000):
         """
         Create delivery time trend analysis with multiple metrics.
         
         Args:
             save_html (bool): Whether to save as HTML file
+            max_points (int): Maximum points per line trace; longer series
+                are downsampled with LTTB. None plots every point
             
         Returns:
             plotly.graph_objects.Figure: Multi-metric delivery trends
         """
-        if self.sample_data is None:
+        if self._totals is None:
             self.load_data()
         
-        # Prepare data
-        hourly_stats = self.sample_data.groupby('hour').agg({
-            'delivery_time_minutes': ['mean', 'std'],
-            'orders_fulfilled': 'sum',
-            'orders_cancelled': 'sum',
-            'csat_score': 'mean'
-        }).round(2)
-        
-        hourly_stats.columns = ['avg_delivery_time', 'delivery_std', 'fulfilled', 'cancelled', 'avg_csat']
-        hourly_stats = hourly_stats.reset_index()
+        # Prepare data; rates are float32 like the aggregated measures, so
+        # every trace serializes as a 4-byte array. Values stay unrounded:
+        # the hover and text templates format them in the browser
+        hourly_stats = self._hourly_stats.reset_index()
         hourly_stats['total_orders'] = hourly_stats['fulfilled'] + hourly_stats['cancelled']
-        hourly_stats['success_rate'] = (hourly_stats['fulfilled'] / hourly_stats['total_orders'] * 100).round(1)
+        hourly_stats['success_rate'] = (hourly_stats['fulfilled'] / hourly_stats['total_orders'] * 100).astype(np.float32)
+        
+        # Bound the points each line trace sends to the browser
+        delivery_x, delivery_y = _downsample(hourly_stats['hour'], hourly_stats['avg_delivery_time'], max_points)
+        success_x, success_y = _downsample(hourly_stats['hour'], hourly_stats['success_rate'], max_points)
+        csat_x, csat_y = _downsample(hourly_stats['hour'], hourly_stats['avg_csat'], max_points)
+        
+        scatter = _scatter_trace(len(delivery_x))
         
         # Create subplot figure
         fig = make_subplots(
@@ -155,9 +679,9 @@ class FlipkartVisualizationSuite:
         
         # Delivery time trend
         fig.add_trace(
-            go.Scatter(
-                x=hourly_stats['hour'],
-                y=hourly_stats['avg_delivery_time'],
+            scatter(
+                x=delivery_x,
+                y=delivery_y,
                 mode='lines+markers',
                 name='Avg Delivery Time',
                 line=dict(color=self.colors['primary'], width=3),
@@ -167,14 +691,13 @@ class FlipkartVisualizationSuite:
         )
         
         # Add target line for delivery time
-        fig.add_hline(y=12, line_dash="dash", line_color="red", 
-                     annotation_text="Target: 12 min", row=1, col=1)
+        _add_target_lines(fig, _DELIVERY_TARGET_LINES)
         
         # Success rate
         fig.add_trace(
-            go.Scatter(
-                x=hourly_stats['hour'],
-                y=hourly_stats['success_rate'],
+            scatter(
+                x=success_x,
+                y=success_y,
                 mode='lines+markers',
                 name='Success Rate',
                 line=dict(color=self.colors['success'], width=3),
@@ -185,9 +708,9 @@ class FlipkartVisualizationSuite:
         
         # Customer satisfaction
         fig.add_trace(
-            go.Scatter(
-                x=hourly_stats['hour'],
-                y=hourly_stats['avg_csat'],
+            scatter(
+                x=csat_x,
+                y=csat_y,
                 mode='lines+markers',
                 name='Customer Satisfaction',
                 line=dict(color=self.colors['info'], width=3),
@@ -228,7 +751,7 @@ class FlipkartVisualizationSuite:
         fig.update_yaxes(title_text="Number of Orders", row=2, col=2)
         
         if save_html:
-            fig.write_html('visualizations/delivery_trends.html')
+            self._save_html(fig, 'delivery_trends')
             print("✅ Delivery trends dashboard saved as HTML")
         
         return fig
@@ -243,19 +766,14 @@ class FlipkartVisualizationSuite:
         Returns:
             plotly.graph_objects.Figure: Performance comparison charts
         """
-        if self.sample_data is None:
+        if self._totals is None:
             self.load_data()
         
         # Calculate store performance metrics
-        store_performance = self.sample_data.groupby('dark_store_id').agg({
-            'orders_fulfilled': 'sum',
-            'orders_cancelled': 'sum',
-            'delivery_time_minutes': 'mean',
-            'csat_score': 'mean'
-        }).round(2)
+        store_performance = self._store_stats.copy()
         
         store_performance['total_orders'] = store_performance['orders_fulfilled'] + store_performance['orders_cancelled']
-        store_performance['success_rate'] = (store_performance['orders_fulfilled'] / store_performance['total_orders'] * 100).round(1)
+        store_performance['success_rate'] = (store_performance['orders_fulfilled'] / store_performance['total_orders'] * 100).astype(np.float32)
         store_performance = store_performance.reset_index()
         
         # Create comparison charts
@@ -274,7 +792,7 @@ class FlipkartVisualizationSuite:
                 y=store_performance['success_rate'],
                 name='Success Rate',
                 marker_color=self.colors['success'],
-                text=store_performance['success_rate'].astype(str) + '%',
+                texttemplate='%{y:.1f}%',
                 textposition='auto',
                 hovertemplate='Store: %{x}<br>Success Rate: %{y:.1f}%<extra></extra>'
             ),
@@ -282,8 +800,8 @@ class FlipkartVisualizationSuite:
         )
         
         # Delivery time comparison
-        colors = [self.colors['success'] if x <= 15 else self.colors['warning'] if x <= 20 else self.colors['danger'] 
-                 for x in store_performance['delivery_time_minutes']]
+        colors = _DELIVERY_COLORS[np.digitize(store_performance['delivery_time_minutes'].to_numpy(),
+                                              _DELIVERY_COLOR_BINS, right=True)]
         
         fig.add_trace(
             go.Bar(
@@ -291,7 +809,7 @@ class FlipkartVisualizationSuite:
                 y=store_performance['delivery_time_minutes'],
                 name='Avg Delivery Time',
                 marker_color=colors,
-                text=store_performance['delivery_time_minutes'].astype(str) + ' min',
+                texttemplate='%{y:.1f} min',
                 textposition='auto',
                 hovertemplate='Store: %{x}<br>Delivery Time: %{y:.1f} min<extra></extra>'
             ),
@@ -305,7 +823,7 @@ class FlipkartVisualizationSuite:
                 y=store_performance['csat_score'],
                 name='CSAT Score',
                 marker_color=self.colors['info'],
-                text=store_performance['csat_score'].astype(str),
+                texttemplate='%{y:.2f}',
                 textposition='auto',
                 hovertemplate='Store: %{x}<br>CSAT: %{y:.1f}/5<extra></extra>'
             ),
@@ -319,7 +837,7 @@ class FlipkartVisualizationSuite:
                 y=store_performance['total_orders'],
                 name='Total Orders',
                 marker_color=self.colors['secondary'],
-                text=store_performance['total_orders'].astype(str),
+                texttemplate='%{y}',
                 textposition='auto',
                 hovertemplate='Store: %{x}<br>Orders: %{y}<extra></extra>'
             ),
@@ -338,15 +856,10 @@ class FlipkartVisualizationSuite:
         )
         
         # Add reference lines
-        fig.add_hline(y=90, line_dash="dash", line_color="red", 
-                     annotation_text="Target: 90%", row=1, col=1)
-        fig.add_hline(y=15, line_dash="dash", line_color="red", 
-                     annotation_text="Target: 15 min", row=1, col=2)
-        fig.add_hline(y=4.0, line_dash="dash", line_color="red", 
-                     annotation_text="Target: 4.0", row=2, col=1)
+        _add_target_lines(fig, _STORE_TARGET_LINES)
         
         if save_html:
-            fig.write_html('visualizations/store_performance.html')
+            self._save_html(fig, 'store_performance')
             print("✅ Store performance comparison saved as HTML")
         
         return fig
@@ -361,21 +874,15 @@ class FlipkartVisualizationSuite:
         Returns:
             plotly.graph_objects.Figure: Category analysis charts
         """
-        if self.sample_data is None:
+        if self._totals is None:
             self.load_data()
         
         # Calculate category metrics
-        category_stats = self.sample_data.groupby('category').agg({
-            'demand_quantity': 'sum',
-            'orders_fulfilled': 'sum',
-            'orders_cancelled': 'sum',
-            'delivery_time_minutes': 'mean',
-            'csat_score': 'mean'
-        }).round(2)
+        category_stats = self._category_stats.copy()
         
         category_stats['total_orders'] = category_stats['orders_fulfilled'] + category_stats['orders_cancelled']
-        category_stats['fulfillment_rate'] = (category_stats['orders_fulfilled'] / category_stats['total_orders'] * 100).round(1)
-        category_stats['cancellation_rate'] = (category_stats['orders_cancelled'] / category_stats['total_orders'] * 100).round(1)
+        category_stats['fulfillment_rate'] = (category_stats['orders_fulfilled'] / category_stats['total_orders'] * 100).astype(np.float32)
+        category_stats['cancellation_rate'] = (category_stats['orders_cancelled'] / category_stats['total_orders'] * 100).astype(np.float32)
         category_stats = category_stats.reset_index()
         
         # Create visualizations
@@ -401,7 +908,7 @@ class FlipkartVisualizationSuite:
         
         # Fulfillment vs Cancellation scatter
         fig.add_trace(
-            go.Scatter(
+            _scatter_trace(len(category_stats))(
                 x=category_stats['fulfillment_rate'],
                 y=category_stats['cancellation_rate'],
                 mode='markers+text',
@@ -427,7 +934,7 @@ class FlipkartVisualizationSuite:
                 y=category_stats['delivery_time_minutes'],
                 name='Avg Delivery Time',
                 marker_color=self.colors['warning'],
-                text=category_stats['delivery_time_minutes'].astype(str) + ' min',
+                texttemplate='%{y:.1f} min',
                 textposition='auto',
                 hovertemplate='Category: %{x}<br>Delivery Time: %{y:.1f} min<extra></extra>'
             ),
@@ -441,7 +948,7 @@ class FlipkartVisualizationSuite:
                 y=category_stats['csat_score'],
                 name='CSAT Score',
                 marker_color=self.colors['info'],
-                text=category_stats['csat_score'].astype(str),
+                texttemplate='%{y:.2f}',
                 textposition='auto',
                 hovertemplate='Category: %{x}<br>CSAT: %{y:.1f}/5<extra></extra>'
             ),
@@ -468,7 +975,7 @@ class FlipkartVisualizationSuite:
         fig.update_yaxes(title_text="Score (1-5)", row=2, col=2)
         
         if save_html:
-            fig.write_html('visualizations/category_analysis.html')
+            self._save_html(fig, 'category_analysis')
             print("✅ Category analysis saved as HTML")
         
         return fig
@@ -483,18 +990,19 @@ class FlipkartVisualizationSuite:
         Returns:
             plotly.graph_objects.Figure: KPI dashboard
         """
-        if self.sample_data is None:
+        if self._totals is None:
             self.load_data()
         
         # Calculate key metrics
-        total_orders = len(self.sample_data)
-        total_fulfilled = self.sample_data['orders_fulfilled'].sum()
-        total_cancelled = self.sample_data['orders_cancelled'].sum()
-        avg_delivery_time = self.sample_data['delivery_time_minutes'].mean()
-        avg_csat = self.sample_data['csat_score'].mean()
+        totals = self._totals
+        total_orders = totals['total_orders']
+        total_fulfilled = totals['total_fulfilled']
+        total_cancelled = totals['total_cancelled']
+        avg_delivery_time = totals['avg_delivery_time']
+        avg_csat = totals['avg_csat']
         
         fulfillment_rate = (total_fulfilled / (total_fulfilled + total_cancelled)) * 100
-        on_time_rate = (self.sample_data['delivery_time_minutes'] <= 15).sum() / len(self.sample_data) * 100
+        on_time_rate = totals['on_time_rate']
         
         # Create KPI cards
         fig = make_subplots(
@@ -578,34 +1086,32 @@ class FlipkartVisualizationSuite:
             row=2, col=3)
         
         # Peak hour performance
-        peak_hours_data = self.sample_data[self.sample_data['hour'].isin([8, 18, 19])]
-        peak_performance = peak_hours_data['delivery_time_minutes'].mean()
-        off_peak_data = self.sample_data[~self.sample_data['hour'].isin([7, 8, 9, 17, 18, 19, 20])]
-        off_peak_performance = off_peak_data['delivery_time_minutes'].mean()
+        peak_performance = totals['peak_delivery_time']
+        off_peak_performance = totals['off_peak_delivery_time']
         
         fig.add_trace(go.Bar(
             x=['Peak Hours', 'Off-Peak Hours'],
             y=[peak_performance, off_peak_performance],
             marker_color=[self.colors['danger'], self.colors['success']],
-            text=[f'{peak_performance:.1f} min', f'{off_peak_performance:.1f} min'],
+            texttemplate='%{y:.1f} min',
             textposition='auto'),
             row=3, col=1)
         
         # Category performance pie chart
-        category_fulfillment = self.sample_data.groupby('category')['orders_fulfilled'].sum()
+        category_fulfillment = self._category_stats['orders_fulfilled']
         fig.add_trace(go.Pie(
             labels=category_fulfillment.index,
-            values=category_fulfillment.values,
+            values=category_fulfillment.to_numpy(),
             name="Category Performance"),
             row=3, col=2)
         
         # Store efficiency
-        store_efficiency = self.sample_data.groupby('dark_store_id')['delivery_time_minutes'].mean()
+        store_efficiency = self._store_stats['delivery_time_minutes']
         fig.add_trace(go.Bar(
             x=store_efficiency.index,
-            y=store_efficiency.values,
+            y=store_efficiency.to_numpy(),
             marker_color=self.colors['secondary'],
-            text=[f'{x:.1f} min' for x in store_efficiency.values],
+            texttemplate='%{y:.1f} min',
             textposition='auto'),
             row=3, col=3)
         
@@ -621,40 +1127,73 @@ class FlipkartVisualizationSuite:
         )
         
         if save_html:
-            fig.write_html('visualizations/kpi_dashboard.html')
+            self._save_html(fig, 'kpi_dashboard')
             print("✅ KPI dashboard saved as HTML")
         
         return fig
     
-    def generate_all_visualizations(self):
+    def generate_all_visualizations(self, parallel=True, force=False):
         """
         Generate all visualization charts and save them.
         
+        Charts whose saved HTML was built from the same sample data and
+        chart code are skipped, and when all of them are current the data
+        is not even loaded. The charts are independent once the aggregates
+        are built, so by default each one is built and saved in its own
+        worker process. Workers are spawned rather than forked, so thread
+        pools already started in this process (Numba, pyarrow) are not
+        inherited half-locked. Building falls back to serial when no
+        process pool can be started.
+        
+        Args:
+            parallel (bool): Whether to build the charts in a process pool
+            force (bool): Rebuild every chart even if its HTML is current
+            
         Returns:
-            dict: Dictionary containing all generated figures
+            dict: Dictionary containing the figures generated in this run
         """
-        if not self.load_data():
+        try:
+            fingerprint = _source_fingerprint(self.data_path)
+        except OSError as e:
+            print(f"❌ Error loading data: {str(e)}")
             return None
         
-        print("📊 Generating all visualizations...")
-        print("=" * 40)
-        
-        visualizations = {}
+        current = set() if force else {name for name, _, _ in _CHARTS if _html_is_current(name, fingerprint)}
+        for name in sorted(current):
+            print(f"⏭️ {name} is up to date, skipped")
+        charts = [chart for chart in _CHARTS if chart[0] not in current]
         
-        print("1. Creating demand heatmap...")
-        visualizations['demand_heatmap'] = self.create_demand_heatmap()
+        if not charts:
+            print("✅ All visualizations are up to date")
+            return {}
         
-        print("2. Creating delivery trends dashboard...")
-        visualizations['delivery_trends'] = self.create_delivery_time_trends()
-        
-        print("3. Creating store performance comparison...")
-        visualizations['store_performance'] = self.create_performance_comparison()
+        if not self.load_data():
+            return None
         
-        print("4. Creating category analysis...")
-        visualizations['category_analysis'] = self.create_category_analysis()
+        print("📊 Generating all visualizations...")
+        print("=" * 40)
         
-        print("5. Creating KPI dashboard...")
-        visualizations['kpi_dashboard'] = self.create_kpi_dashboard()
+        for i, (_, _, label) in enumerate(charts, 1):
+            print(f"{i}. {label}")
+        
+        visualizations = None
+        if parallel:
+            # Workers only need the aggregates, so the raw rows are not pickled
+            chart_suite = copy.copy(self)
+            chart_suite.sample_data = None
+            try:
+                # Each spawned worker imports plotly and pandas afresh, so
+                # there is no point starting more of them than there are CPUs
+                with ProcessPoolExecutor(max_workers=min(len(charts), os.cpu_count() or 1),
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    futures = {name: executor.submit(_render_chart, chart_suite, method)
+                               for name, method, _ in charts}
+                    visualizations = {name: future.result() for name, future in futures.items()}
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                print(f"⚠️ Process pool unavailable ({str(e)}), building charts serially")
+        
+        if visualizations is None:
+            visualizations = {name: _render_chart(self, method) for name, method, _ in charts}
         
         print("\n✅ All visualizations generated successfully!")
         print("📁 Files saved in 'visualizations/' directory")
@@ -674,7 +1213,7 @@ def main():
     # Generate all visualizations
     charts = viz_suite.generate_all_visualizations()
     
-    if charts:
+    if charts is not None:
         print(f"\n📈 VISUALIZATION SUMMARY")
         print("-" * 30)
         print(f"Total charts generated: {len(charts)}")